@@ -12,13 +12,23 @@ In-memory session store will be replaced by Redis in task 10.
 
 from __future__ import annotations
 
+import json
+import math
 import uuid
 from datetime import date as date_type, time as time_type
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
+# orjson is optional — used to render the itinerary response when installed.
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 from schemas.constraints import (
     HardConstraints, SoftConstraints, CommonsenseConstraints, ConstraintBundle,
 )
@@ -106,10 +116,60 @@ def _ser_itinerary(it: Itinerary) -> dict:
     }
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode values JSON has no type for: numpy scalars/arrays via tolist()."""
+    tolist = getattr(obj, "tolist", None)
+    if callable(tolist):
+        return tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _finite_or_null(obj: Any) -> Any:
+    """Copy of obj with NaN/±inf replaced by None, matching orjson's output."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite_or_null(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_null(v) for v in obj]
+    if callable(getattr(obj, "tolist", None)):
+        return _finite_or_null(obj.tolist())
+    return obj
+
+
+def _json_response(payload: dict) -> Response:
+    """
+    Render payload straight to a Response.  Returning a Response skips
+    FastAPI's jsonable_encoder pass over every route point.
+
+    With or without orjson the same payloads are accepted and encode to
+    equivalent JSON: numpy scalars/arrays become plain numbers/lists, NaN
+    and ±inf become null (orjson's behaviour — starlette's JSONResponse
+    would raise ValueError), and any other non-JSON type raises TypeError.
+    """
+    if _ORJSON_AVAILABLE:
+        body = orjson.dumps(
+            payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY,
+        )
+    else:
+        body = json.dumps(
+            _finite_or_null(payload),
+            default=_json_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    return Response(body, media_type="application/json")
+
+
 # ── Endpoint ───────────────────────────────────────────────────────────────────
 
-@router.post("/generate", summary="Generate a full multi-day itinerary")
-def generate_itinerary(req: GenerateRequest) -> dict:
+@router.post(
+    "/generate",
+    summary="Generate a full multi-day itinerary",
+    response_class=JSONResponse,
+)
+def generate_itinerary(req: GenerateRequest) -> Response:
     """
     Runs the full FTRM+ACO 5-stage pipeline:
       1. Constraint modelling
@@ -199,10 +259,10 @@ def generate_itinerary(req: GenerateRequest) -> dict:
         "session":     reopt_session,
     }
 
-    return {
+    return _json_response({
         "session_id": session_id,
         "itinerary": _ser_itinerary(itinerary),
-    }
+    })
 
 
 # ── Utility: expose store to other routes ─────────────────────────────────────
@@ -93,6 +93,24 @@ SC_AGGREGATION_METHOD: str = os.getenv("SC_AGGREGATION_METHOD", "sum")
 # RECOMMENDED: "best_ant" (lower noise for itinerary planning)
 ACO_PHEROMONE_STRATEGY: str = os.getenv("ACO_PHEROMONE_STRATEGY", "best_ant")
 
+# ACO execution backend: "python" | "numba"
+# "numba" builds all ants of an iteration in parallel (requires numba + numpy;
+# falls back to "python" with a warning when they are not installed).
+ACO_BACKEND: str = os.getenv("ACO_BACKEND", "python")
+
+# Weather replans: run an indoor-first and an unbiased ACO colony in parallel
+# processes and keep the higher-value plan (off by default — costs 2 workers).
+REPLAN_MULTI_COLONY: bool = os.getenv("REPLAN_MULTI_COLONY", "false").lower() in ("1", "true", "yes")
+
+# Suppress the re-optimization approval-gate and advisory panels (batch simulation / replay)
+REOPT_QUIET: bool = os.getenv("REOPT_QUIET", "false").lower() in ("1", "true", "yes")
+
+# Hysteresis for rejected environmental gates: after a REJECT/KEEP the same
+# disruption type is only re-raised once its reading exceeds the rejected one
+# by REOPT_HYSTERESIS_BAND, or after REOPT_REJECT_COOLDOWN_S seconds.
+REOPT_HYSTERESIS_BAND: float = float(os.getenv("REOPT_HYSTERESIS_BAND", "0.05"))
+REOPT_REJECT_COOLDOWN_S: float = float(os.getenv("REOPT_REJECT_COOLDOWN_S", "300"))
+
 # ── PostgreSQL ────────────────────────────────────────────────────────────────
 # Schema defined in docs/database/05-implementation.sql
 # Apply with: python scripts/run_migrations.py
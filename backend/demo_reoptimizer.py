@@ -275,7 +275,6 @@ def run_demo() -> None:
     session2.state.current_day = session2.total_days
     # Mark remaining time as tight so same-day reschedule also fails
     session2.state.current_time = "16:30"
-    session2.state.remaining_minutes = 30
 
     session2.check_conditions(
         crowd_level=0.82,
@@ -1087,6 +1087,7 @@ def _run_reoptimize_demo(itinerary: Itinerary) -> None:
     print("=" * 60)
     import json as _json
     print(_json.dumps(session.summary(), indent=2, default=str))
+    session.close()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -175,6 +175,29 @@ class DisruptionMemory:
             S_pti_replacement  = S_rep,
         ))
 
+    def record_replacements(
+        self,
+        originals:   list[tuple[str, float]],
+        replacement: str,
+        reason:      str,
+        S_rep:       float = 0.0,
+    ) -> None:
+        """
+        Store several stop-replacement pairs that share one replacement
+        (every stop an advisory displaced → its top alternative).
+        originals holds (stop name, S_orig) pairs.
+        """
+        self.replacement_history.extend(
+            ReplacementRecord(
+                original_stop      = original,
+                replacement_stop   = replacement,
+                reason             = reason,
+                S_pti_original     = S_orig,
+                S_pti_replacement  = S_rep,
+            )
+            for original, S_orig in originals
+        )
+
     def record_hunger(
         self,
         trigger_time:    str,
@@ -226,14 +249,19 @@ class DisruptionMemory:
         user has responded via the approval gate (APPROVE / REJECT / MODIFY).
         Mapped into replacement_history so it surfaces in summarize().
         """
-        for stop in (impacted_stops or []):
-            self.replacement_history.append(ReplacementRecord(
+        if not impacted_stops:
+            return
+        reason = f"{disruption_type}:{user_response}"
+        self.replacement_history.extend(
+            ReplacementRecord(
                 original_stop     = stop,
                 replacement_stop  = "",
-                reason            = f"{disruption_type}:{user_response}",
+                reason            = reason,
                 S_pti_original    = severity,
                 S_pti_replacement = 0.0,
-            ))
+            )
+            for stop in impacted_stops
+        )
 
     # ── Query helpers ─────────────────────────────────────────────────────────
 
@@ -0,0 +1,129 @@
+"""
+modules/optimization/aco_kernels.py
+-------------------------------------
+Numba-compiled ACO tour construction (optional accelerated backend).
+
+Selected via FTRMParameters.backend = "numba" (config.ACO_BACKEND).
+The kernel mirrors ACOOptimizer._construct_tour() exactly, but operates on
+dense NumPy arrays and builds all ants of one iteration in parallel (prange).
+
+Array layout (n = number of graph nodes, index = position in graph.nodes):
+  tau  : (n, n) float64 — pheromone τ_ij
+  eta  : (n, n) float32 — heuristic η_ij (Eq 12); only weights the roulette
+  D    : (n, n) float64 — travel time Dij [minutes]; inf = no edge
+  STi  : (n,)   float64 — visit duration [minutes]
+  S    : (n,)   float64 — S_pti per node (HC gate: S ≤ 0 → infeasible)
+
+numba / numpy are NOT required dependencies — when either is missing
+NUMBA_AVAILABLE is False and ACOOptimizer stays on the pure-Python path.
+
+Note: numba keeps an independent RNG stream per worker thread, so
+ACOOptimizer(seed=...) does not make the numba backend reproducible.
+"""
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _construct_one(tau, eta, D, STi, S, Tmax, alpha, beta, start, end, path):
+        """
+        Build one ant's tour into `path` (pre-filled with -1).
+
+        Feasibility (Eq 8, Eq 10, HC gate) and roulette-wheel selection
+        (Eq 13) follow ACOOptimizer._get_feasible_nodes / _select_next.
+
+        Returns:
+            (length, cost, sat) — path[:length] is the node-index sequence,
+            cost = Σ (Dij + STi), sat = Σ S_pti × STi.
+        """
+        n = STi.shape[0]
+        visited = np.zeros(n, np.bool_)
+        cand    = np.empty(n, np.int64)
+        weights = np.empty(n, np.float64)
+
+        cur = start
+        visited[cur] = True
+        path[0] = cur
+        length  = 1
+        elapsed = 0.0
+        sat     = 0.0
+
+        while True:
+            m = 0
+            total = 0.0
+            for j in range(n):
+                if visited[j] or j == end or S[j] <= 0.0:
+                    continue
+                d = D[cur, j]
+                if d == np.inf or elapsed + d + STi[j] > Tmax:
+                    continue
+                w = (tau[cur, j] ** alpha) * (eta[cur, j] ** beta)
+                cand[m] = j
+                weights[m] = w
+                total += w
+                m += 1
+            if m == 0:
+                break
+
+            if total == 0.0:
+                nxt = cand[np.random.randint(0, m)]
+            else:
+                r = np.random.random() * total
+                acc = 0.0
+                nxt = cand[m - 1]          # fallback (float round-off)
+                for c in range(m):
+                    acc += weights[c]
+                    if r <= acc:
+                        nxt = cand[c]
+                        break
+
+            elapsed += D[cur, nxt] + STi[nxt]
+            sat     += S[nxt] * STi[nxt]
+            visited[nxt] = True
+            path[length] = nxt
+            length += 1
+            cur = nxt
+
+        # Close tour at end node if specified
+        if end >= 0 and not visited[end]:
+            path[length] = end
+            length += 1
+
+        return length, elapsed, sat
+
+    @njit(parallel=True, cache=True)
+    def construct_tours(tau, eta, D, STi, S, Tmax, alpha, beta, start, end, num_ants):
+        """
+        Build num_ants tours in parallel (one prange lane per ant).
+
+        Args:
+            end : index of the end node, or -1 for an open route.
+
+        Returns:
+            (paths, lengths, costs, sats) where paths[k, :lengths[k]] is the
+            node-index sequence of ant k.
+        """
+        n = STi.shape[0]
+        paths   = np.full((num_ants, n + 1), -1, np.int64)
+        lengths = np.zeros(num_ants, np.int64)
+        costs   = np.zeros(num_ants, np.float64)
+        sats    = np.zeros(num_ants, np.float64)
+
+        for k in prange(num_ants):
+            length, cost, sat = _construct_one(
+                tau, eta, D, STi, S, Tmax, alpha, beta, start, end, paths[k],
+            )
+            lengths[k] = length
+            costs[k]   = cost
+            sats[k]    = sat
+
+        return paths, lengths, costs, sats
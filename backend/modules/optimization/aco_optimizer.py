@@ -37,9 +37,17 @@ Equation references:
 
 Confirmed defaults (2026-02-20):
   α=2.0, β=3.0, ρ=0.1, Q=1.0, τ_init=1.0, strategy="best_ant"
+
+Backends (FTRMParameters.backend):
+  "python" : pure-Python dict-based implementation (default, no dependencies)
+  "numba"  : parallel tour construction over dense arrays (aco_kernels.py);
+             falls back to "python" when numba/numpy are not installed.
+             aco_kernels (and so numba/numpy) is imported on the first
+             "numba" run only — the default backend never loads it.
 """
 
 from __future__ import annotations
+import logging
 import math
 import random
 from dataclasses import dataclass, field
@@ -47,6 +55,8 @@ from typing import Optional
 from schemas.ftrm import FTRMGraph, FTRMNode, FTRMParameters
 from modules.optimization.heuristic import compute_eta
 
+logger = logging.getLogger(__name__)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tour representation
@@ -126,6 +136,14 @@ class ACOOptimizer:
         if seed is not None:
             random.seed(seed)
 
+        # FTRMParameters is frozen — unpack the hot scalars once so the
+        # per-step code (Eq 10, 13, 14, 15, 16) reads flat attributes.
+        self._Tmax  = float(params.Tmax)
+        self._alpha = float(params.alpha)
+        self._beta  = float(params.beta)
+        self._rho   = float(params.rho)
+        self._Q     = float(params.Q)
+
         # Initialise pheromone matrix τ_ij = τ_init for all edges
         self.tau: dict[tuple[int, int], float] = {
             (e.i, e.j): params.tau_init
@@ -149,13 +167,22 @@ class ACOOptimizer:
         Returns:
             Best Tour found across all iterations and ants.
         """
+        if self.params.backend == "numba":
+            from modules.optimization.aco_kernels import NUMBA_AVAILABLE
+            if NUMBA_AVAILABLE:
+                return self._run_numba()
+            logger.warning("ACO backend 'numba' requested but numba is not installed "
+                           "— falling back to the pure-Python backend.")
+
+        num_ants = self.params.num_ants
+        best_ant = self.params.pheromone_update_strategy == "best_ant"
         best_tour = Tour()
         best_tour.total_satisfaction = -1.0
 
         for iteration in range(self.params.num_iterations):
             iteration_tours: list[Tour] = []
 
-            for _ in range(self.params.num_ants):
+            for _ in range(num_ants):
                 tour = self._construct_tour()
                 iteration_tours.append(tour)
 
@@ -164,14 +191,114 @@ class ACOOptimizer:
                     best_tour = tour
 
             # Pheromone update
-            if self.params.pheromone_update_strategy == "best_ant":
+            if best_ant:
                 self._global_pheromone_update(best_tour)  # Eq 16
             else:
-                for t in iteration_tours:
-                    self._local_pheromone_update(t)       # Eq 15
+                self._local_pheromone_update(iteration_tours)  # Eq 15
 
         return best_tour
 
+    def _run_numba(self) -> Tour:
+        """
+        run() on the "numba" backend.
+
+        τ, η and Dij are packed into dense (n × n) arrays once; each iteration
+        builds all ants in parallel via aco_kernels.construct_tours() and
+        applies Eq 15 / Eq 16 as whole-array NumPy operations.  self.tau is
+        synced back from the array when the run completes.
+
+        η is stored as float32: it only weights the roulette wheel, so the
+        halved footprint is free.  τ stays float64 (Eq 16 scales unused edges
+        by ρ every iteration, which would underflow float32) and so does D
+        (it feeds the Eq 10 Tmax check, which must match the Python backend).
+        """
+        import numpy as np
+        from modules.optimization.aco_kernels import construct_tours
+
+        nodes = self.graph.nodes
+        ids   = [n.node_id for n in nodes]
+        index = {nid: k for k, nid in enumerate(ids)}
+        n     = len(ids)
+
+        tau_rows, tau_cols = self._edge_index(self.tau, index)
+        tau = np.full((n, n), 1e-6)          # floor matches tau.get(..., 1e-6)
+        tau[tau_rows, tau_cols] = np.fromiter(self.tau.values(), np.float64, len(self.tau))
+        eta = np.zeros((n, n), np.float32)
+        rows, cols = self._edge_index(self.eta, index)
+        eta[rows, cols] = np.fromiter(self.eta.values(), np.float64, len(self.eta))
+        adjacency = self.graph.adjacency
+        D = np.full((n, n), np.inf)
+        rows, cols = self._edge_index(adjacency, index)
+        D[rows, cols] = np.fromiter(adjacency.values(), np.float64, len(adjacency))
+        STi = np.array([node.STi for node in nodes], dtype=np.float64)
+        S   = np.array([self.S_pti.get(nid, 0.0) for nid in ids], dtype=np.float64)
+
+        start = index[self.start_node]
+        end   = index[self.end_node] if self.end_node is not None else -1
+
+        p = self.params
+        num_ants = p.num_ants
+        best_ant = p.pheromone_update_strategy == "best_ant"
+        Tmax, alpha, beta, rho = self._Tmax, self._alpha, self._beta, self._rho
+        best_tour = Tour()
+        best_tour.total_satisfaction = -1.0
+        best_idx_path: list[int] = []
+
+        for iteration in range(p.num_iterations):
+            paths, lengths, costs, sats = construct_tours(
+                tau, eta, D, STi, S, Tmax, alpha, beta, start, end, num_ants,
+            )
+            iteration_paths: list[tuple[list[int], float]] = []
+
+            for k in range(num_ants):
+                idx_path = paths[k, :lengths[k]].tolist()
+                cost     = float(costs[k])
+                iteration_paths.append((idx_path, cost))
+
+                # Track global best
+                if sats[k] > best_tour.total_satisfaction:
+                    best_tour = Tour(
+                        path=[ids[x] for x in idx_path],
+                        total_cost=cost,
+                        total_satisfaction=float(sats[k]),
+                    )
+                    best_idx_path = idx_path
+
+            # Pheromone update
+            if best_ant:
+                # Eq 16: τ ← ρτ + (1−ρ)δ
+                tau *= rho
+                self._deposit_array(tau, best_idx_path, best_tour.total_cost, 1.0 - rho)
+            else:
+                # Eq 15 per ant, evaporation separated (see _local_pheromone_update)
+                m = len(iteration_paths)
+                tau *= (1.0 - rho) ** m
+                for k, (idx_path, cost) in enumerate(iteration_paths):
+                    self._deposit_array(tau, idx_path, cost, (1.0 - rho) ** (m - 1 - k))
+
+        self.tau = dict(zip(self.tau, tau[tau_rows, tau_cols].tolist()))
+        return best_tour
+
+    @staticmethod
+    def _edge_index(edges: dict[tuple[int, int], float], index: dict[int, int]):
+        """(rows, cols) int arrays locating each (i, j) key of edges, in dict order."""
+        import numpy as np
+
+        m = len(edges)
+        rows = np.fromiter((index[i] for i, _ in edges), np.int64, m)
+        cols = np.fromiter((index[j] for _, j in edges), np.int64, m)
+        return rows, cols
+
+    def _deposit_array(self, tau, idx_path: list[int], total_cost: float, scale: float) -> None:
+        """Add scale × δ_ij (Eq 14) to every edge of idx_path in the dense τ array."""
+        if len(idx_path) < 2:
+            return
+        Q = self._Q
+        deposit = Q if total_cost <= 0.0 else Q / total_cost
+        # Eq 8 (visit-once): no edge repeats within a path, so the fancy-indexed
+        # += never drops a duplicate update.
+        tau[idx_path[:-1], idx_path[1:]] += scale * deposit
+
     # ── Tour construction ─────────────────────────────────────────────────────
 
     def _construct_tour(self) -> Tour:
@@ -230,8 +357,8 @@ class ACOOptimizer:
 
         P_ij = (τ_ij^α × η_ij^β) / Σ_k∈feasible (τ_ik^α × η_ik^β)   [Eq 13]
         """
-        alpha = self.params.alpha
-        beta = self.params.beta
+        alpha = self._alpha
+        beta = self._beta
 
         weights: list[float] = []
         for j in feasible:
@@ -271,7 +398,8 @@ class ACOOptimizer:
           - Time: elapsed + Dij + STj ≤ Tmax (Eq 10)
         """
         feasible = []
-        Tmax = self.params.Tmax
+        Tmax = self._Tmax
+        row = self.graph.Dij_row(current)
 
         for node in self.graph.nodes:
             j = node.node_id
@@ -285,8 +413,8 @@ class ACOOptimizer:
                 continue
 
             # Tmax check (Eq 10)
-            Dij = self.graph.get_Dij(current, j)
-            if Dij == float("inf"):
+            Dij = row.get(j, math.inf)
+            if Dij == math.inf:
                 continue
             if elapsed + Dij + node.STi > Tmax:
                 continue
@@ -306,9 +434,9 @@ class ACOOptimizer:
         Falls back to all-ones deposit if cost is zero (degenerate tour).
         """
         if tour.total_cost <= 0.0:
-            deposit = self.params.Q
+            deposit = self._Q
         else:
-            deposit = self.params.Q / tour.total_cost
+            deposit = self._Q / tour.total_cost
 
         delta: dict[tuple[int, int], float] = {}
         for k in range(len(tour.path) - 1):
@@ -317,20 +445,38 @@ class ACOOptimizer:
 
         return delta
 
+    # ── Pheromone evaporation / deposit primitives ───────────────────────────
+
+    def _evaporate(self, factor: float) -> None:
+        """τ_ij ← factor × τ_ij for every edge — one O(n²) pass."""
+        tau = self.tau
+        for edge in tau:
+            tau[edge] *= factor
+
+    def _deposit(self, tour: Tour, scale: float) -> None:
+        """τ_ij += scale × δ_ij on the edges of *tour* only — O(len(path))."""
+        tau = self.tau
+        for edge, d in self._compute_delta(tour).items():
+            if edge in tau:
+                tau[edge] += scale * d
+
     # ── Equation (15): Local pheromone update ────────────────────────────────
 
-    def _local_pheromone_update(self, tour: Tour) -> None:
+    def _local_pheromone_update(self, tours: list[Tour]) -> None:
         """
         τ_ij ← (1 − ρ) × τ_ij + δ_ij   [Eq 15]
-        Applied per-ant after each tour construction.
-        """
-        rho = self.params.rho
-        delta = self._compute_delta(tour)
+        Applied per-ant, in construction order, for every tour of the iteration.
 
-        for (i, j) in list(self.tau.keys()):
-            evaporated = (1.0 - rho) * self.tau[(i, j)]
-            deposited  = delta.get((i, j), 0.0)
-            self.tau[(i, j)] = evaporated + deposited
+        Evaporation is separated from deposit: m sequential per-ant updates
+        equal one evaporation pass with factor (1 − ρ)^m plus ant k's δ scaled
+        by (1 − ρ)^(m−1−k) on its own path edges — O(n²) + O(n·m) instead of
+        O(n²·m), with identical results.
+        """
+        rho = self._rho
+        m = len(tours)
+        self._evaporate((1.0 - rho) ** m)
+        for k, tour in enumerate(tours):
+            self._deposit(tour, (1.0 - rho) ** (m - 1 - k))
 
     # ── Equation (16): Global pheromone update ────────────────────────────────
 
@@ -340,10 +486,6 @@ class ACOOptimizer:
         Applied once per iteration using only the best tour found so far.
         This is the "best-ant" strategy — reduces noise vs all-ants update.
         """
-        rho = self.params.rho
-        delta = self._compute_delta(best_tour)
-
-        for (i, j) in list(self.tau.keys()):
-            evaporated = rho * self.tau[(i, j)]
-            deposited  = (1.0 - rho) * delta.get((i, j), 0.0)
-            self.tau[(i, j)] = evaporated + deposited
+        rho = self._rho
+        self._evaporate(rho)
+        self._deposit(best_tour, 1.0 - rho)
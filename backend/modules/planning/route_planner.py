@@ -162,6 +162,7 @@ class RoutePlanner:
             num_iterations=config.ACO_ITERATIONS,
             sc_aggregation_method=config.SC_AGGREGATION_METHOD,
             pheromone_update_strategy=config.ACO_PHEROMONE_STRATEGY,
+            backend=config.ACO_BACKEND,
         )
 
     # ── Public entry point ────────────────────────────────────────────────────
@@ -172,7 +172,7 @@ class AgentController:
         next_stop = ""
         next_outdoor = False
         next_spti = 0.0
-        excluded = (state.visited_stops | state.skipped_stops | state.deferred_stops)
+        excluded = state.excluded_stops
         if state.current_day_plan:
             for rp in state.current_day_plan.route_points:
                 if rp.name not in excluded:
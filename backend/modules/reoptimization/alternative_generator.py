@@ -18,6 +18,7 @@ Design principles:
 
 from __future__ import annotations
 
+import heapq
 import math
 from dataclasses import dataclass, field
 from datetime import time as dtime
@@ -261,10 +262,12 @@ class AlternativeGenerator:
                 )
                 scored.append((composite, opt))
 
-        # ── Sort + assign ranks ───────────────────────────────────────────────
-        scored.sort(key=lambda x: x[0], reverse=True)
+        # ── Top-n + assign ranks ──────────────────────────────────────────────
+        # nlargest == sorted(..., reverse=True)[:n] (ties keep input order)
+        # without sorting the whole candidate list.
+        top = heapq.nlargest(n, scored, key=lambda x: x[0])
         result: list[AlternativeOption] = []
-        for rank, (_, opt) in enumerate(scored[:n], start=1):
+        for rank, (_, opt) in enumerate(top, start=1):
             opt.rank = rank
             result.append(opt)
 
@@ -203,6 +203,14 @@ class CrowdAdvisory:
     def __init__(self, historical_tool: HistoricalInsightTool | None = None) -> None:
         self._history = historical_tool or HistoricalInsightTool()
 
+    def prefetch(self, record: AttractionRecord, city: str = "") -> HistoricalInsight:
+        """
+        Resolve (and cache) the historical insight for an upcoming stop so a
+        later build() for that stop skips the LLM round-trip.  Safe to call
+        from a worker thread — HistoricalInsightTool locks its cache.
+        """
+        return self._history.get(record, city=city)
+
     def build(
         self,
         crowded_stop:      str,
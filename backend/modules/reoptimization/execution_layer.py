@@ -23,6 +23,7 @@ Safety guardrails (enforced before every execution):
 
 from __future__ import annotations
 
+from dataclasses import fields as _dc_fields
 from typing import Optional
 
 from modules.reoptimization.agent_action import ActionType, AgentAction
@@ -46,19 +47,26 @@ _logger = StructuredLogger()
 
 # ── State hashing ─────────────────────────────────────────────────────────────
 
-_TRANSIENT_FIELDS = frozenset({"current_day_plan", "replan_pending"})
+_TRANSIENT_FIELDS = frozenset({
+    "current_day_plan", "replan_pending",
+    "_excluded_union", "_excluded_version", "_stops_version",
+})
 
 
 def compute_state_hash(state: TripState) -> str:
     """Deterministic SHA-256 of the mutable parts of TripState.
 
     Ignores transient fields (current_day_plan, replan_pending) that change
-    as a side-effect of replanning rather than as a true state mutation.
+    as a side-effect of replanning rather than as a true state mutation, and
+    TripState's derived caches (_excluded_union and its version counters),
+    which are rebuilt from the visited/skipped/deferred sets.
     """
     snapshot: dict = {}
-    for k, v in sorted(vars(state).items()):
+    for f in sorted(_dc_fields(state), key=lambda f: f.name):
+        k = f.name
         if k in _TRANSIENT_FIELDS:
             continue
+        v = getattr(state, k)
         if isinstance(v, set):
             v = sorted(v)
         snapshot[k] = v
@@ -291,11 +299,8 @@ class ExecutionLayer:
             return ExecutionResult(action, executed=False, error="No target_poi")
 
         state.defer_stop(poi)
-        filtered = [
-            a for a in remaining
-            if a.name not in (state.visited_stops | state.skipped_stops
-                              | state.deferred_stops)
-        ]
+        excluded = state.excluded_stops
+        filtered = [a for a in remaining if a.name not in excluded]
         day_plan = state.current_day_plan
         if day_plan is None:
             return ExecutionResult(action, executed=True, new_plan=None)
@@ -519,12 +519,7 @@ class LocalRepair:
             )
 
         # Shared exclusion set (all currently-planned and permanently excluded stops)
-        excluded: set[str] = (
-            state.visited_stops
-            | state.skipped_stops
-            | state.deferred_stops
-            | {rp.name for rp in points}
-        )
+        excluded: set[str] = state.excluded_stops | {rp.name for rp in points}
 
         # Pool metadata for the disrupted stop
         origin_attr    = next((a for a in remaining_pool if a.name == disrupted_stop_name), None)
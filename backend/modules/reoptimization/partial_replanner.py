@@ -14,23 +14,94 @@ Reuses all existing FTRM + ACO machinery unchanged.
 """
 
 from __future__ import annotations
-from datetime import date
+import dataclasses
+from datetime import date, time
+from typing import Any, Hashable
 
-from schemas.constraints import ConstraintBundle, SoftConstraints
+from schemas.constraints import ConstraintBundle
 from schemas.itinerary import BudgetAllocation, DayPlan
 from schemas.ftrm import FTRMParameters
 from modules.tool_usage.attraction_tool import AttractionRecord
 from modules.tool_usage.distance_tool import DistanceTool
 from modules.tool_usage.time_tool import TimeTool
 from modules.planning.route_planner import RoutePlanner, DEFAULT_DAY_END
-from modules.reoptimization.trip_state import TripState
+from modules.optimization.satisfaction import evaluate_satisfaction
+from modules.reoptimization.trip_state import TripState, _hhmm_to_minutes
 from modules.observability.logger import StructuredLogger
 import config
+import atexit
+import logging
+import threading
 import time as _time_mod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+logger = logging.getLogger(__name__)
 _perf_logger = StructuredLogger()
 
 
+def _empty_day(state: TripState) -> DayPlan:
+    """
+    Empty DayPlan for today's no-op replans.
+
+    A fresh instance each time — callers store the result as
+    state.current_day_plan and may append to its route_points, so a shared
+    sentinel would leak stops between replans.
+    """
+    return DayPlan(day_number=state.current_day, date=state.current_day_date)
+
+
+def _plan_day_worker(
+    distance_tool: DistanceTool,
+    time_tool: TimeTool,
+    params: FTRMParameters,
+    plan_kwargs: dict,
+) -> DayPlan:
+    """ProcessPoolExecutor entry point for one multi-colony replan."""
+    return RoutePlanner(
+        distance_tool=distance_tool,
+        time_tool=time_tool,
+        ftrm_params=params,
+    )._plan_single_day(**plan_kwargs)
+
+
+# One process pool shared by every PartialReplanner — spawning workers costs
+# more than a replan, so it is created on the first multi-colony replan and
+# kept until interpreter exit.
+_COLONY_WORKERS = 2
+_colony_pool: ProcessPoolExecutor | None = None
+_colony_pool_lock = threading.Lock()
+
+
+def _get_colony_pool() -> ProcessPoolExecutor:
+    global _colony_pool
+    with _colony_pool_lock:
+        if _colony_pool is None:
+            _colony_pool = ProcessPoolExecutor(max_workers=_COLONY_WORKERS)
+            atexit.register(_colony_pool.shutdown, wait=False, cancel_futures=True)
+        return _colony_pool
+
+
+def _discard_colony_pool() -> None:
+    """Drop a broken pool so the next multi-colony replan starts a fresh one."""
+    global _colony_pool
+    with _colony_pool_lock:
+        if _colony_pool is not None:
+            _colony_pool.shutdown(wait=False, cancel_futures=True)
+            _colony_pool = None
+
+
+def _shift_time(t: time, offset: int) -> time:
+    """
+    Shift a clock time by whole minutes, wrapping at midnight.
+
+    Same result as TimeTool.add_minutes() for integer offsets, without the
+    datetime.combine/timedelta round-trip per route point.
+    """
+    m = (t.hour * 60 + t.minute + offset) % 1440
+    return t.replace(hour=m // 60, minute=m % 60)
+
+
 class PartialReplanner:
     """
     Wraps RoutePlanner._plan_single_day() for mid-trip replanning.
@@ -51,6 +122,32 @@ class PartialReplanner:
     ) -> None:
         self._distance  = distance_tool or DistanceTool()
         self._time      = time_tool or TimeTool()
+        # Cached (indoor, outdoor) split of the last remaining_attractions pool
+        # seen with deprioritize_outdoor=True, keyed by _outdoor_partition().
+        self._partition_key: Hashable = None
+        self._partition: tuple[list[AttractionRecord], list[AttractionRecord]] = ([], [])
+        self.invalidate_config_cache()
+
+    def invalidate_config_cache(self) -> None:
+        """
+        Re-read the ACO settings from config.
+
+        They are snapshotted here rather than looked up on every replan; call
+        this after changing config.ACO_* at runtime.
+        """
+        self._aco_defaults: dict = dict(
+            alpha=config.ACO_ALPHA,
+            beta=config.ACO_BETA,
+            rho=config.ACO_RHO,
+            Q=config.ACO_Q,
+            tau_init=config.ACO_TAU_INIT,
+            num_ants=config.ACO_NUM_ANTS,
+            num_iterations=config.ACO_ITERATIONS,
+            sc_aggregation_method=config.SC_AGGREGATION_METHOD,
+            pheromone_update_strategy=config.ACO_PHEROMONE_STRATEGY,
+            backend=config.ACO_BACKEND,
+        )
+        self._multi_colony: bool = config.REPLAN_MULTI_COLONY
 
     def replan(
         self,
@@ -59,14 +156,20 @@ class PartialReplanner:
         constraints: ConstraintBundle,
         day_end_time: str = "20:00",
         deprioritize_outdoor: bool = False,
+        pool_version: Hashable = None,
     ) -> DayPlan:
         """
         Generate a new DayPlan for the rest of today from current position.
+
+        pool_version, if given, must change whenever the membership of
+        remaining_attractions changes (the session passes its
+        _remaining_version); it lets weather replans reuse the indoor/outdoor
+        split without rescanning the pool.
         """
         _t0 = _time_mod.perf_counter()
         result = self._replan_inner(
             state, remaining_attractions, constraints,
-            day_end_time, deprioritize_outdoor,
+            day_end_time, deprioritize_outdoor, pool_version,
         )
         _perf_logger.log("default", "PERFORMANCE", {
             "component": "PartialReplanner.replan",
@@ -81,6 +184,7 @@ class PartialReplanner:
         constraints: ConstraintBundle,
         day_end_time: str = "20:00",
         deprioritize_outdoor: bool = False,
+        pool_version: Hashable = None,
     ) -> DayPlan:
         """
         Internal implementation of replan().
@@ -94,50 +198,44 @@ class PartialReplanner:
             deprioritize_outdoor:   If True (weather event), outdoor attractions
                                     are moved to the end of the scoring pool so
                                     the ACO prefers indoor alternatives.
+            pool_version:           Caller's version of remaining_attractions;
+                                    see replan().
 
         Returns:
             New DayPlan covering the remaining stops for today.
         """
-        # ── 1. Filter pool ────────────────────────────────────────────────────
-        excluded = state.visited_stops | state.skipped_stops | state.deferred_stops
-        pool = [a for a in remaining_attractions if a.name not in excluded]
+        # ── 1. Compute remaining Tmax (cheap — checked before any filtering) ──
+        remaining_min = state.remaining_minutes_today(day_end_time)
+        if remaining_min <= 0:
+            return _empty_day(state)
+
+        # ── 2. Filter pool ────────────────────────────────────────────────────
+        excluded = state.excluded_stops
 
         if deprioritize_outdoor:
-            indoor  = [a for a in pool if not getattr(a, "is_outdoor", False)]
-            outdoor = [a for a in pool if getattr(a, "is_outdoor", False)]
-            pool = indoor + outdoor   # indoor attractions evaluated first by ACO
+            indoor, outdoor = self._outdoor_partition(remaining_attractions, pool_version)
+            # indoor attractions evaluated first by ACO.  Built in place:
+            # _plan_single_day indexes/slices the pool, so it must be a list.
+            pool = [a for a in indoor if a.name not in excluded]
+            pool.extend(a for a in outdoor if a.name not in excluded)
+        else:
+            pool = [a for a in remaining_attractions if a.name not in excluded]
 
+        # Drop stops the ACO can never reach today (Eq 10: Dij + STi > Tmax
+        # from the start node) so they do not inflate the n² graph.
+        if pool:
+            pool = self._prune_unreachable(pool, state, remaining_min)
         if not pool:
             # Nothing left to plan — return empty day
-            return DayPlan(day_number=state.current_day, date=state.current_day_date)
-
-        # ── 2. Compute remaining Tmax ─────────────────────────────────────────
-        remaining_min = state.remaining_minutes_today(day_end_time)
-        if remaining_min <= 0:
-            return DayPlan(day_number=state.current_day, date=state.current_day_date)
+            return _empty_day(state)
 
         # ── 3. Build a RoutePlanner with reduced Tmax ─────────────────────────
         adjusted_params = FTRMParameters(
             Tmax=remaining_min,                      # ← reduced day window
-            alpha=config.ACO_ALPHA,
-            beta=config.ACO_BETA,
-            rho=config.ACO_RHO,
-            Q=config.ACO_Q,
-            tau_init=config.ACO_TAU_INIT,
-            num_ants=config.ACO_NUM_ANTS,
-            num_iterations=config.ACO_ITERATIONS,
-            sc_aggregation_method=config.SC_AGGREGATION_METHOD,
-            pheromone_update_strategy=config.ACO_PHEROMONE_STRATEGY,
+            **self._aco_defaults,
         )
 
-        planner = RoutePlanner(
-            distance_tool=self._distance,
-            time_tool=self._time,
-            ftrm_params=adjusted_params,
-        )
-
-        # ── 5. Delegate to _plan_single_day from current position ─────────────
-        new_plan = planner._plan_single_day(
+        plan_kwargs = dict(
             day_number=state.current_day,
             plan_date=state.current_day_date,
             available_attractions=pool,
@@ -147,20 +245,127 @@ class PartialReplanner:
             is_arrival_or_departure_day=False,   # mid-trip replan: no boundary penalty
         )
 
+        # ── 4. Optional: race indoor-first vs unbiased colony (weather) ───────
+        new_plan = None
+        if deprioritize_outdoor and self._multi_colony:
+            kept = {a.name for a in pool}
+            unbiased = [a for a in remaining_attractions if a.name in kept]
+            new_plan = self._plan_multi_colony(
+                adjusted_params, plan_kwargs, [pool, unbiased],
+            )
+
+        # ── 5. Delegate to _plan_single_day from current position ─────────────
+        if new_plan is None:
+            planner = RoutePlanner(
+                distance_tool=self._distance,
+                time_tool=self._time,
+                ftrm_params=adjusted_params,
+            )
+            new_plan = planner._plan_single_day(**plan_kwargs)
+
         # Shift all route point times forward to start from current_time
-        ch, cm = map(int, state.current_time.split(":"))
-        current_minutes = ch * 60 + cm
+        current_minutes = _hhmm_to_minutes(state.current_time)
         default_start_h, default_start_m = 9, 0
         default_start_minutes = default_start_h * 60 + default_start_m
         offset = current_minutes - default_start_minutes  # may be 0 if exactly 09:00
 
         if offset != 0 and new_plan.route_points:
             for rp in new_plan.route_points:
-                rp.arrival_time   = self._time.add_minutes(rp.arrival_time,   offset)
-                rp.departure_time = self._time.add_minutes(rp.departure_time, offset)
+                rp.arrival_time   = _shift_time(rp.arrival_time,   offset)
+                rp.departure_time = _shift_time(rp.departure_time, offset)
 
         return new_plan
 
+    def _plan_multi_colony(
+        self,
+        params: FTRMParameters,
+        plan_kwargs: dict,
+        pools: list[list[AttractionRecord]],
+    ) -> DayPlan | None:
+        """
+        Run one ACO colony per pool ordering in the shared worker pool and keep
+        the plan with the highest Σ S_pti·STi over its scheduled stops — the
+        objective _plan_single_day's ACO maximises (Eq 5 numerator), with S_pti
+        from the same Eq 1→4 aggregation as RoutePlanner._compute_satisfaction.
+
+        Workers receive this replanner's Distance/Time tools, so both colonies
+        plan on the same Dij as the in-process path.  Returns None on any pool
+        failure so the caller falls back to the single in-process colony.
+        """
+        jobs = [{**plan_kwargs, "available_attractions": p} for p in pools]
+        n = len(jobs)
+        try:
+            plans = list(_get_colony_pool().map(
+                _plan_day_worker,
+                [self._distance] * n, [self._time] * n, [params] * n, jobs,
+            ))
+        except Exception as exc:
+            logger.warning("Multi-colony replan failed (%s) — running single colony", exc)
+            if isinstance(exc, BrokenProcessPool):
+                _discard_colony_pool()
+            return None
+
+        method = params.sc_aggregation_method
+        s_pti: dict[str, float] = {}
+        for a in pools[0]:
+            si = min(a.rating / 5.0, 1.0)
+            s_pti[a.name] = evaluate_satisfaction(
+                [1 if si > 0.0 else 0], [si], [1.0], method=method,
+            )["S"]
+
+        def _objective(plan: DayPlan) -> float:
+            return sum(
+                s_pti.get(rp.name, 0.0) * rp.visit_duration_minutes
+                for rp in plan.route_points
+            )
+
+        return max(plans, key=_objective)
+
+    def _outdoor_partition(
+        self,
+        remaining_attractions: list[AttractionRecord],
+        pool_version: Hashable = None,
+    ) -> tuple[list[AttractionRecord], list[AttractionRecord]]:
+        """
+        Return (indoor, outdoor) for remaining_attractions, preserving order.
+
+        Keyed on the caller's pool_version, or — when none is given — on the
+        tuple of record ids, so an in-place edit that keeps the list and its
+        length still invalidates the split.  Repeated weather replans against
+        the same pool reuse it.
+        """
+        key = (
+            ("v", pool_version) if pool_version is not None
+            else tuple(map(id, remaining_attractions))
+        )
+        if key != self._partition_key:
+            indoor:  list[AttractionRecord] = []
+            outdoor: list[AttractionRecord] = []
+            for a in remaining_attractions:
+                (outdoor if getattr(a, "is_outdoor", False) else indoor).append(a)
+            self._partition_key = key
+            self._partition     = (indoor, outdoor)
+        return self._partition
+
+    def _prune_unreachable(
+        self,
+        pool: list[AttractionRecord],
+        state: TripState,
+        remaining_min: int,
+    ) -> list[AttractionRecord]:
+        """
+        Keep only attractions whose travel time from the current position plus
+        visit duration fits in remaining_min.  Uses the same DistanceTool as the
+        graph build, so nothing the ACO could have selected is removed.
+        """
+        travel = self._distance.travel_time_minutes
+        lat, lon = state.current_lat, state.current_lon
+        return [
+            a for a in pool
+            if travel(lat, lon, a.location_lat, a.location_lon)
+               + a.visit_duration_minutes <= remaining_min
+        ]
+
     def apply_preference_update(
         self,
         constraints: ConstraintBundle,
@@ -169,16 +374,21 @@ class PartialReplanner:
     ) -> ConstraintBundle:
         """
         Return an updated ConstraintBundle with a single SoftConstraints field changed.
+        Thin wrapper over apply_preference_updates().
+        """
+        return self.apply_preference_updates(constraints, {field_name: value})
+
+    def apply_preference_updates(
+        self,
+        constraints: ConstraintBundle,
+        updates: dict[str, Any],
+    ) -> ConstraintBundle:
+        """
+        Return an updated ConstraintBundle with several SoftConstraints fields
+        changed in one rebuild.
         Used by ReOptimizationSession when a USER_PREFERENCE_CHANGE event fires.
         """
-        soft_dict = {
-            k: getattr(constraints.soft, k)
-            for k in constraints.soft.__dataclass_fields__
-        }
-        soft_dict[field_name] = value
-        new_soft = SoftConstraints(**soft_dict)
-        return ConstraintBundle(
-            hard=constraints.hard,
-            soft=new_soft,
-            commonsense=constraints.commonsense,
-        )
+        if not updates:
+            return constraints
+        new_soft = dataclasses.replace(constraints.soft, **updates)
+        return dataclasses.replace(constraints, soft=new_soft)
@@ -30,23 +30,33 @@ Lifecycle:
 """
 
 from __future__ import annotations
+import bisect
+import sys
+import textwrap
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field as _dc_field
-from datetime import date
-from typing import Optional
+from functools import cached_property, lru_cache
+from itertools import islice
+from datetime import date, time as _dtime
+from typing import Any, Optional
 
+import config
 from schemas.constraints import ConstraintBundle
 from schemas.itinerary import BudgetAllocation, DayPlan, Itinerary
 from modules.tool_usage.attraction_tool import AttractionRecord
 from modules.tool_usage.historical_tool import HistoricalInsightTool
 from modules.tool_usage.weather_tool import WeatherTool
 from modules.tool_usage.traffic_tool import TrafficTool
-from modules.reoptimization.trip_state import TripState
+from modules.reoptimization.trip_state import TripState, _hhmm_to_minutes
 from modules.reoptimization.event_handler import EventHandler, EventType, ReplanDecision
-from modules.reoptimization.condition_monitor import ConditionMonitor
+from modules.reoptimization.condition_monitor import ConditionMonitor, WEATHER_SEVERITY
 from modules.reoptimization.partial_replanner import PartialReplanner
 from modules.reoptimization.crowd_advisory import CrowdAdvisory, CrowdAdvisoryResult
 from modules.reoptimization.weather_advisor import WeatherAdvisor, WeatherAdvisoryResult
-from modules.reoptimization.traffic_advisor import TrafficAdvisor, TrafficAdvisoryResult
+from modules.reoptimization.traffic_advisor import (
+    TrafficAdvisor, TrafficAdvisoryResult, pool_coords,
+)
 from modules.memory.disruption_memory import DisruptionMemory
 from modules.reoptimization.user_edit_handler import (
     UserEditHandler, DislikeResult, ReplaceResult, SkipResult,
@@ -73,7 +83,7 @@ from modules.reoptimization.agents.explanation_agent import ExplanationAgent
 from modules.reoptimization.agents.agent_dispatcher import AgentDispatcher, DispatchResult
 
 
-@dataclass
+@dataclass(slots=True)
 class ProposedAction:
     """One candidate action inside a PendingDecision payload."""
     # Environmental gate: "DEFER" | "REPLACE" | "SHIFT_TIME" | "KEEP_AS_IS"
@@ -83,7 +93,7 @@ class ProposedAction:
     details: dict = _dc_field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingDecision:
     """
     Frozen snapshot presented to the user before any state mutation.
@@ -93,7 +103,7 @@ class PendingDecision:
     """
     disruption_type: str              # "CROWD"|"WEATHER"|"TRAFFIC"|"USER_ACTION"
     impacted_pois: list               # list[str]
-    reason: str
+    _reason: str                      # read via .reason (see below)
     missed_value: float               # avg S_pti proxy of removed/deferred stops
     proposed_actions: list            # list[ProposedAction]
     suggested_alternatives: list      # top-3 by S_pti from remaining pool
@@ -104,18 +114,111 @@ class PendingDecision:
     _user_event_payload: dict = _dc_field(default_factory=dict)
     impact_summary: dict = _dc_field(default_factory=dict)
     # feasibility_change, satisfaction_change, time_change, cost_change
+    _reason_parts: list = _dc_field(default_factory=list)
+    # (fmt, args) pairs from check_conditions; joined on first read of .reason
+    _rich_alternatives: list = _dc_field(default_factory=list)
+    # list[AlternativeOption] — ranked options shown in the gate panel
+
+    @property
+    def reason(self) -> str:
+        """Human-readable reason; env-gate parts are joined on first read."""
+        if not self._reason and self._reason_parts:
+            self._reason = " | ".join(fmt % args for fmt, args in self._reason_parts)
+        return self._reason
+
+
+# Advisory panels (crowd / weather / traffic / user-edit)
+_PANEL_W    = 64
+_PANEL_SEP  = "-" * _PANEL_W
+_PANEL_WRAP = _PANEL_W - 4          # body text width inside the 4-space indent
+# Rules framing the gate / timetable panels
+_RULE_W     = 60
+_RULE_HEAVY = "═" * _RULE_W
+_RULE_LIGHT = "─" * _RULE_W
+
+# Fixed header blocks of the threshold-based advisory panels (str.format
+# templates — one format call per panel instead of one f-string per line).
+_CROWD_HEAD = "\n".join((
+    "",
+    "  [Crowd] " + _PANEL_SEP,
+    "  {header}: '{stop}'",
+    "  Live crowd: {level:.0%}  |  Your tolerance: {thr:.0%}",
+    "  " + _PANEL_SEP,
+))
+_WEATHER_HEAD = "\n".join((
+    "",
+    "  [Weather] " + _PANEL_SEP,
+    "  {header}: '{cond}'",
+    "  Severity: {sev:.0%}  |  Threshold: {thr:.0%}",
+    "  " + _PANEL_SEP,
+))
+_TRAFFIC_HEAD = "\n".join((
+    "",
+    "  [Traffic] " + _PANEL_SEP,
+    "  {header}",
+    "  Traffic: {level:.0%}  |  Threshold: {thr:.0%}  |  "
+    "Delay factor: \u00d7{factor:.1f}",
+    "  " + _PANEL_SEP,
+))
+
+
+def _emit(lines: list[str]) -> None:
+    """Write a pre-built panel to stdout in one call (one lock / flush)."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+@lru_cache(maxsize=256)
+def _wrap_lines(text: str, width: int) -> tuple[str, ...]:
+    """textwrap.wrap, cached — advisory text repeats across re-renders."""
+    return tuple(textwrap.wrap(text, width=width))
+
+
+def _teaser_lines(historical_importance: str) -> tuple[str, ...]:
+    """First sentence of an attraction's history, wrapped for the Context: column."""
+    return _wrap_lines(historical_importance.split(".")[0] + ".", _PANEL_W - 16)
+
+
+def _impact_summary(
+    feasibility_change: Any,
+    satisfaction_change: Any,
+    time_change: str,
+    cost_change: str,
+) -> dict:
+    """PendingDecision.impact_summary for the user-action gate (fixed key order)."""
+    return {
+        "feasibility_change":  feasibility_change,
+        "satisfaction_change": satisfaction_change,
+        "time_change":         time_change,
+        "cost_change":         cost_change,
+    }
+
+
+def _clock_time(hhmm: str) -> _dtime:
+    """
+    "HH:MM" → datetime.time via the cached minute parser; 09:00 if malformed.
+    """
+    try:
+        h, m = divmod(_hhmm_to_minutes(hhmm), 60)
+        return _dtime(h, m)
+    except (ValueError, AttributeError):
+        return _dtime(9, 0)
+
+
+def _neg_rating(a: AttractionRecord) -> float:
+    """Sort key for _remaining_sorted (highest rating first)."""
+    return -a.rating
 
 
 # Event types that MUST go through the approval gate before any state mutation
-_USER_GATE_EVENTS: frozenset = frozenset({
-    "user_skip",
-    "user_skip_current",
-    "user_dislike_next",
-    "user_replace_poi",
-    "user_add",
-    "user_pref",
-    "user_reorder",
-    "user_manual_reopt",
+_USER_GATE_EVENTS: frozenset[EventType] = frozenset({
+    EventType.USER_SKIP,
+    EventType.USER_SKIP_CURRENT,
+    EventType.USER_DISLIKE_NEXT,
+    EventType.USER_REPLACE_POI,
+    EventType.USER_ADD_STOP,
+    EventType.USER_PREFERENCE_CHANGE,
+    EventType.USER_REORDER,
+    EventType.USER_MANUAL_REOPT,
 })
 
 
@@ -141,20 +244,37 @@ class ReOptimizationSession:
         self.state                 = state
         self.constraints           = constraints
         self._remaining            = list(remaining_attractions)
+        # name → record index over _remaining (first occurrence wins, matching
+        # the linear scans it replaces).  Kept in sync wherever _remaining changes.
+        self._remaining_by_name: dict[str, AttractionRecord] = {
+            a.name: a for a in reversed(self._remaining)
+        }
+        self._spti_cache: dict[str, float] = {}   # see _spti_proxy()
+        # _remaining ordered by rating (desc, stable) for _top_alternatives()
+        self._remaining_sorted: list[AttractionRecord] = sorted(
+            self._remaining, key=_neg_rating
+        )
+        # _remaining minus state.excluded_stops — see _active_pool()
+        self._remaining_version: int = 0
+        self._active_key: tuple[int, int] = (-1, -1)
+        self._active: list[AttractionRecord] = []
+        # (version, pool_coords(_remaining)) — see _remaining_coords()
+        self._coords_memo: tuple[int, tuple | None] = (-1, None)
+        # ((stops_version, remaining_version), stop lists) — see _summary_stops()
+        self._summary_memo: tuple[tuple[int, int], tuple] | None = None
         self.budget                = budget
         self.total_days            = total_days
+        # Fixed for the session — neither the allocation nor the day count changes
+        self._meal_budget_per_day: float = budget.Restaurants / max(total_days, 1)
 
         self._event_handler        = EventHandler()
         self._condition_monitor    = ConditionMonitor(
             constraints.soft, self._remaining, total_days=total_days
         )
         self._partial_replanner    = PartialReplanner()
-        self._crowd_advisory       = CrowdAdvisory(HistoricalInsightTool())
-        self._weather_advisor      = WeatherAdvisor()
-        self._traffic_advisor      = TrafficAdvisor()
+        # Crowd / weather / traffic / user-edit / hunger-fatigue advisors are
+        # built on first use — see the cached properties below __init__.
         self._disruption_memory    = DisruptionMemory()
-        self._user_edit            = UserEditHandler()
-        self._hf_advisor           = HungerFatigueAdvisor()
         self._weather_tool         = WeatherTool()
         self._traffic_tool         = TrafficTool()
         self._local_repair_engine  = LocalRepair()
@@ -197,6 +317,16 @@ class ReOptimizationSession:
 
         # Destination city for historical insight lookup
         self._city = constraints.hard.destination_city if constraints.hard else ""
+        # Full city attraction pool keyed by name — lazily fetched by the
+        # REPLACE gate when an alternative is not in _remaining
+        self._city_attractions_by_name: dict[str, AttractionRecord] | None = None
+
+        # Background warm-up of the next stop's historical insight (see
+        # advance_to_stop); a crowd advisory for that stop waits on it.
+        # Started on the first prefetch, shut down by close().
+        self._prefetch_pool: ThreadPoolExecutor | None = None
+        self._next_stop_fetch: Future | None = None
+        self._prefetched_name: str = ""
 
         # Thresholds exposed for display / debugging
         self.thresholds            = self._condition_monitor.thresholds
@@ -215,6 +345,41 @@ class ReOptimizationSession:
         # Set by check_conditions(); cleared by resolve_pending()
         self.pending_decision: Optional[PendingDecision] = None
 
+        # Suppress the gate and advisory panels / banners (batch simulation,
+        # replay) — the printers return before formatting anything.
+        self._quiet: bool = config.REOPT_QUIET
+
+        # Last rejected reading per environmental disruption type:
+        # {disruption_type: (severity, time.monotonic())}.  check_conditions
+        # stays silent inside the hysteresis band until the cooldown expires.
+        self._recent_rejects: dict[str, tuple[float, float]] = {}
+        self._hyst_band: float     = config.REOPT_HYSTERESIS_BAND
+        self._hyst_cooldown: float = config.REOPT_REJECT_COOLDOWN_S
+
+    # ── Lazily built advisors ─────────────────────────────────────────────────
+    # Many sessions (API requests, replays) never hit a given disruption path,
+    # so these are constructed on first access rather than in __init__.
+
+    @cached_property
+    def _crowd_advisory(self) -> CrowdAdvisory:
+        return CrowdAdvisory(HistoricalInsightTool())
+
+    @cached_property
+    def _weather_advisor(self) -> WeatherAdvisor:
+        return WeatherAdvisor()
+
+    @cached_property
+    def _traffic_advisor(self) -> TrafficAdvisor:
+        return TrafficAdvisor()
+
+    @cached_property
+    def _user_edit(self) -> UserEditHandler:
+        return UserEditHandler()
+
+    @cached_property
+    def _hf_advisor(self) -> HungerFatigueAdvisor:
+        return HungerFatigueAdvisor()
+
     # ── Factory ───────────────────────────────────────────────────────────────
 
     @classmethod
@@ -252,6 +417,22 @@ class ReOptimizationSession:
             total_days=total_days,
         )
 
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Shut down the background prefetch thread.  Safe to call twice."""
+        pool, self._prefetch_pool = self._prefetch_pool, None
+        self._next_stop_fetch = None
+        self._prefetched_name = ""
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "ReOptimizationSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # ── Advance through the plan normally ────────────────────────────────────
 
     def advance_to_stop(
@@ -276,9 +457,28 @@ class ReOptimizationSession:
 
         # Update remaining pool
         self._remaining = [a for a in self._remaining if a.name not in self.state.visited_stops]
+        self._remaining_by_name = {a.name: a for a in reversed(self._remaining)}
+        self._spti_cache.clear()
+        self._remaining_version += 1
+        self._remaining_sorted = [
+            a for a in self._remaining_sorted
+            if a.name not in self.state.visited_stops
+        ]   # filtering keeps the rating order — no re-sort
         self._condition_monitor.update_remaining(self._remaining)
         print(f"  [Session] Visited '{stop_name}' at {self.state.current_time}.")
         print(f"  [Session] Remaining stops: {len(self._remaining)}")
+
+        # Overlap the next stop's historical-insight lookup with travel time
+        next_name = self._next_unvisited_stop_name()
+        next_rec  = self._remaining_by_name.get(next_name)
+        if (next_rec is not None and next_name != self._prefetched_name
+                and not next_rec.historical_importance):   # record-backed: no LLM call to hide
+            if self._prefetch_pool is None:
+                self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+            self._next_stop_fetch = self._prefetch_pool.submit(
+                self._crowd_advisory.prefetch, next_rec, self._city
+            )
+            self._prefetched_name = next_name
         # keep only for internal reference; remove the old combined print
         if False:  # replaced above
             print(f"  [Session] Visited '{stop_name}' at {self.state.current_time}. "
@@ -316,6 +516,10 @@ class ReOptimizationSession:
             session.resolve_pending("REJECT")    — keep unchanged
             session.resolve_pending("MODIFY", action_index=<int>)
         """
+        # Nothing left to protect — skip the fetches and the monitor entirely
+        if not self._remaining:
+            return None
+
         # ── Auto-fetch weather from OpenWeatherMap when not manually supplied ─
         if weather_condition is None:
             try:
@@ -330,9 +534,7 @@ class ReOptimizationSession:
 
         # ── Auto-fetch traffic from Google Routes API when not manually supplied
         if traffic_level is None and next_stop_name:
-            next_stop = next(
-                (a for a in self._remaining if a.name == next_stop_name), None
-            )
+            next_stop = self._remaining_by_name.get(next_stop_name)
             if next_stop is not None:
                 try:
                     t = self._traffic_tool.fetch(
@@ -355,6 +557,18 @@ class ReOptimizationSession:
                   "\"MODIFY\") first.")
             return None
 
+        # Fast path: every reading below its threshold → ConditionMonitor would
+        # return no decisions (same >= comparisons as ConditionMonitor.check).
+        # Read from the monitor: update_remaining() re-derives its thresholds,
+        # so self.thresholds can lag behind after a pool change.
+        thr = self._condition_monitor.thresholds
+        if ((crowd_level is None or crowd_level < thr.crowd)
+                and (traffic_level is None or traffic_level < thr.traffic)
+                and (weather_condition is None
+                     or WEATHER_SEVERITY.get(weather_condition.lower(), 0.0)
+                        < thr.weather)):
+            return None
+
         decisions = self._condition_monitor.check(
             state=self.state,
             crowd_level=crowd_level,
@@ -375,29 +589,86 @@ class ReOptimizationSession:
             return None
 
         # ── Classify by type ────────────────────────────────────────────────
-        crowd_ds   = [d for d in candidates if d.metadata.get("crowd_action")]
-        weather_ds = [d for d in candidates if d.metadata.get("weather_action")]
-        traffic_ds = [d for d in candidates if d.metadata.get("traffic_action")]
+        # Single pass; buckets are checked crowd → weather → traffic below, so
+        # a decision only needs to land in the first one it qualifies for.
+        crowd_ds:   list = []
+        weather_ds: list = []
+        traffic_ds: list = []
+        for d in candidates:
+            m = d.metadata
+            if "crowd_action" in m:
+                crowd_ds.append(d)
+            elif "weather_action" in m:
+                weather_ds.append(d)
+            elif "traffic_action" in m:
+                traffic_ds.append(d)
+
+        # Type + severity first, so a suppressed re-raise skips the per-stop
+        # classification and alternative generation below.
+        if crowd_ds:
+            disruption_type = "CROWD"
+            severity = max(d.metadata.get("crowd_level", crowd_level or 0.0)
+                           for d in crowd_ds)
+        elif weather_ds:
+            disruption_type = "WEATHER"
+            severity = max(d.metadata.get("severity", 0.0) for d in weather_ds)
+        elif traffic_ds:
+            disruption_type = "TRAFFIC"
+            severity = max(d.metadata.get("traffic_level", traffic_level or 0.0)
+                           for d in traffic_ds)
+        else:
+            disruption_type = "UNKNOWN"
+            severity = 0.0
+
+        # ── Hysteresis: don't re-raise a just-rejected, barely-changed reading ─
+        prev = self._recent_rejects.get(disruption_type)
+        if prev is not None:
+            if time.monotonic() - prev[1] >= self._hyst_cooldown:
+                del self._recent_rejects[disruption_type]
+            elif severity < prev[0] + self._hyst_band:
+                return None
+
+        # Hot attributes bound once for the classification / alternatives work
+        state     = self.state
+        remaining = self._remaining
+        by_name   = self._remaining_by_name
+        thr_c     = thr.crowd
+        thr_w     = thr.weather
+        thr_t     = thr.traffic
+        soft      = self.constraints.soft if self.constraints else None
 
         impacted_pois: list[str]     = []
+        impacted_set: set[str]       = set()   # O(1) mirror of impacted_pois
         proposed_actions: list       = []
-        reason_parts: list[str]      = []
-        severity: float              = 0.0
-        disruption_type: str         = "UNKNOWN"
+        # Running S_pti-proxy total over impacted stops in the pool (missed_value)
+        score_sum: float             = 0.0
+        score_n: int                 = 0
+
+        def _add_impacted(name: str) -> bool:
+            """Append name to impacted_pois once; True if it was new."""
+            nonlocal score_sum, score_n
+            if name in impacted_set:
+                return False
+            impacted_set.add(name)
+            impacted_pois.append(name)
+            if name in by_name:
+                score_sum += self._spti_proxy(name)
+                score_n   += 1
+            return True
+
+        reason_parts: list[tuple]    = []   # (fmt, args) — joined lazily
 
         if crowd_ds:
-            disruption_type = "CROWD"
             for cd in crowd_ds:
                 m   = cd.metadata
                 stp = m.get("stop_name", next_stop_name or "next stop")
                 act = m.get("crowd_action", "inform_user")
                 clv = m.get("crowd_level", crowd_level or 0.0)
-                thr = m.get("threshold",   self.thresholds.crowd)
-                severity = max(severity, clv)
-                if stp not in impacted_pois:
-                    impacted_pois.append(stp)
+                thr = m.get("threshold",   thr_c)
+                _add_impacted(stp)
                 reason_parts.append(
-                    f"crowd {clv:.0%} > threshold {thr:.0%} at '{stp}'"
+                    ("crowd %.0f%% > threshold %.0f%% at '%s'",
+                     (clv * 100, thr * 100, stp))
                 )
                 if act == "reschedule_same_day":
                     proposed_actions.append(
@@ -406,7 +677,7 @@ class ReOptimizationSession:
                 elif act == "reschedule_future_day":
                     proposed_actions.append(
                         ProposedAction("DEFER", stp,
-                                       {"target_day": self.state.current_day + 1})
+                                       {"target_day": state.current_day + 1})
                     )
                 else:  # inform_user
                     proposed_actions.append(
@@ -414,56 +685,48 @@ class ReOptimizationSession:
                     )
 
         elif weather_ds:
-            disruption_type = "WEATHER"
             for wd in weather_ds:
                 m         = wd.metadata
                 condition = m.get("condition", weather_condition or "bad_weather")
                 sev       = m.get("severity",  0.0)
-                thr       = m.get("threshold", self.thresholds.weather)
-                severity  = max(severity, sev)
+                thr       = m.get("threshold", thr_w)
                 reason_parts.append(
-                    f"{condition} (severity {sev:.0%} > threshold {thr:.0%})"
+                    ("%s (severity %.0f%% > threshold %.0f%%)",
+                     (condition, sev * 100, thr * 100))
                 )
                 # Impacted: the next outdoor stop (if known) plus any
                 # outdoor stops visible in the remaining pool
-                if next_stop_is_outdoor and next_stop_name:
-                    if next_stop_name not in impacted_pois:
-                        impacted_pois.append(next_stop_name)
-                        proposed_actions.append(
-                            ProposedAction("DEFER", next_stop_name, {})
-                        )
-                for rec in self._remaining:
+                if (next_stop_is_outdoor and next_stop_name
+                        and _add_impacted(next_stop_name)):
+                    proposed_actions.append(
+                        ProposedAction("DEFER", next_stop_name, {})
+                    )
+                for rec in remaining:
                     if (getattr(rec, "is_outdoor", False)
-                            and rec.name not in impacted_pois):
-                        impacted_pois.append(rec.name)
+                            and _add_impacted(rec.name)):
                         proposed_actions.append(
                             ProposedAction("DEFER", rec.name, {})
                         )
 
         elif traffic_ds:
-            disruption_type = "TRAFFIC"
             for td in traffic_ds:
                 m     = td.metadata
                 tlv   = m.get("traffic_level", traffic_level or 0.0)
-                thr   = m.get("threshold",     self.thresholds.traffic)
+                thr   = m.get("threshold",     thr_t)
                 delay = m.get("delay_minutes",
                                estimated_traffic_delay_minutes)
-                severity = max(severity, tlv)
                 stp  = next_stop_name or "current stop"
                 reason_parts.append(
-                    f"traffic {tlv:.0%} > threshold {thr:.0%},"
-                    f" delay +{delay} min"
+                    ("traffic %.0f%% > threshold %.0f%%, delay +%s min",
+                     (tlv * 100, thr * 100, delay))
                 )
-                if stp not in impacted_pois:
-                    impacted_pois.append(stp)
+                _add_impacted(stp)
                 # Heuristic: if stop exists in remaining pool use its
                 # category-based score proxy; default to DEFER
-                stop_rec = next(
-                    (a for a in self._remaining if a.name == stp), None
-                )
+                stop_rec = by_name.get(stp)
                 if stop_rec is not None:
                     # Use rating as a simple Spti proxy (0-1 normalised)
-                    s_proxy = min(1.0, max(0.0, stop_rec.rating / 5.0))
+                    s_proxy = self._spti_proxy(stp)
                     if s_proxy >= 0.65:
                         proposed_actions.append(
                             ProposedAction("DEFER", stp,
@@ -477,49 +740,28 @@ class ReOptimizationSession:
                 else:
                     proposed_actions.append(ProposedAction("DEFER", stp, {}))
 
-        # ── Compute missed_value (avg S_pti proxy of impacted stops) ─────────
-        scores_for_impacted = []
-        for name in impacted_pois:
-            rec = next((a for a in self._remaining if a.name == name), None)
-            if rec is not None:
-                scores_for_impacted.append(min(1.0, max(0.0, rec.rating / 5.0)))
-        missed_value = (
-            sum(scores_for_impacted) / len(scores_for_impacted)
-            if scores_for_impacted else 0.0
-        )
+        # ── missed_value = avg S_pti proxy of impacted stops (accumulated above)
+        missed_value = score_sum / score_n if score_n else 0.0
 
         # ── Context-aware alternatives via AlternativeGenerator ─────────────
         primary_disrupted = impacted_pois[0] if impacted_pois else ""
-        primary_rec = next(
-            (a for a in self._remaining if a.name == primary_disrupted), None
-        )
-        candidates_pool = [
-            a for a in self._remaining
-            if a.name not in impacted_pois
-            and a.name not in self.state.visited_stops
-            and a.name not in self.state.skipped_stops
-        ]
-        from datetime import time as _dtime
-        try:
-            _h, _m = map(int, self.state.current_time.split(":"))
-            _t_cur = _dtime(_h, _m)
-        except (ValueError, AttributeError):
-            _t_cur = _dtime(9, 0)
+        primary_rec = by_name.get(primary_disrupted)
+        excluded = impacted_set.union(state.visited_stops, state.skipped_stops)
+        candidates_pool = [a for a in remaining if a.name not in excluded]
+        _t_cur = _clock_time(state.current_time)
 
         _current_weather = weather_condition or "clear"
         alt_context = {
-            "current_lat":        self.state.current_lat,
-            "current_lon":        self.state.current_lon,
+            "current_lat":        state.current_lat,
+            "current_lon":        state.current_lon,
             "current_time":       _t_cur,
             "weather_condition":  _current_weather,
             "crowd_forecast":     {},          # can be injected in future
             "meal_lunch_window":  (
-                self.constraints.soft.meal_lunch_window
-                if self.constraints and self.constraints.soft else ("12:00", "14:00")
+                soft.meal_lunch_window if soft else ("12:00", "14:00")
             ),
             "meal_dinner_window": (
-                self.constraints.soft.meal_dinner_window
-                if self.constraints and self.constraints.soft else ("19:00", "21:00")
+                soft.meal_dinner_window if soft else ("19:00", "21:00")
             ),
             "n_alternatives":     5,
         }
@@ -538,15 +780,15 @@ class ReOptimizationSession:
         self.pending_decision = PendingDecision(
             disruption_type     = disruption_type,
             impacted_pois       = impacted_pois,
-            reason              = " | ".join(reason_parts),
+            _reason             = "",
+            _reason_parts       = reason_parts,
             missed_value        = missed_value,
             proposed_actions    = proposed_actions,
             suggested_alternatives = suggested_alternatives,
             severity            = severity,
             _raw_decisions      = candidates,
+            _rich_alternatives  = rich_alternatives,
         )
-        # Attach rich alternatives as extra attribute (not in dataclass)
-        self.pending_decision._rich_alternatives = rich_alternatives  # type: ignore[attr-defined]
 
         self._print_pending_decision(self.pending_decision)
         return None   # ← NO automatic replan; user must call resolve_pending()
@@ -586,7 +828,6 @@ class ReOptimizationSession:
             return None
 
         pd  = self.pending_decision
-        W   = 60
         dec = user_decision.strip().upper()
 
         # ── Normalise legacy aliases ─────────────────────────────────────────
@@ -610,9 +851,11 @@ class ReOptimizationSession:
 
         # ── KEEP — no mutation, clear gate ───────────────────────────────────
         if dec == "KEEP":
-            print(f"\n  [Gate] {'═' * W}")
-            print(f"  [Gate] Decision: KEEP — proceeding with original plan.")
-            print(f"  [Gate] {'═' * W}\n")
+            self._print_gate_banner("Decision: KEEP — proceeding with original plan.")
+            if not pd._user_event_type:
+                self._recent_rejects[pd.disruption_type] = (
+                    pd.severity, time.monotonic(),
+                )
             self._disruption_memory.record_generic(
                 disruption_type = pd.disruption_type,
                 severity        = pd.severity,
@@ -625,9 +868,7 @@ class ReOptimizationSession:
 
         # ── WAIT — defer disrupted POI; schedule frozen; no full replan ───────
         if dec == "WAIT":
-            print(f"\n  [Gate] {'═' * W}")
-            print(f"  [Gate] Decision: WAIT — deferring to later today.")
-            print(f"  [Gate] {'═' * W}\n")
+            self._print_gate_banner("Decision: WAIT — deferring to later today.")
             for stop in pd.impacted_pois:
                 self.state.defer_stop(stop)
             self._disruption_memory.record_generic(
@@ -642,18 +883,11 @@ class ReOptimizationSession:
 
         # ── SKIP — remove only the disrupted POI; rest unchanged ──────────────
         if dec == "SKIP":
-            print(f"\n  [Gate] {'═' * W}")
-            print(f"  [Gate] Decision: SKIP — removing disrupted stop.")
-            print(f"  [Gate] {'═' * W}\n")
+            self._print_gate_banner("Decision: SKIP — removing disrupted stop.")
             for stop in pd.impacted_pois:
                 self.state.mark_skipped(stop)
             # Recalculate timing for remaining stops (local repair only)
-            _skip_pool = [
-                a for a in self._remaining
-                if a.name not in self.state.skipped_stops
-                   and a.name not in self.state.visited_stops
-                   and a.name not in self.state.deferred_stops
-            ]
+            _skip_pool = self._active_pool()
             _skip_stop = pd.impacted_pois[0] if pd.impacted_pois else ""
             _is_user_initiated_skip = pd._user_event_type in (
                 "user_skip", "user_skip_current",
@@ -695,34 +929,34 @@ class ReOptimizationSession:
                 return None
 
             chosen_alt = rich[idx]
-            print(f"\n  [Gate] {'═' * W}")
-            print(f"  [Gate] Decision: REPLACE with '{chosen_alt.name}'")
-            print(f"  [Gate] Distance: {chosen_alt.distance_km:.1f} km  "
-                  f"Travel: {chosen_alt.travel_time_min} min  "
-                  f"Crowd: {chosen_alt.predicted_crowd:.0%}")
-            print(f"  [Gate] {'═' * W}\n")
+            self._print_gate_banner(
+                f"Decision: REPLACE with '{chosen_alt.name}'",
+                f"Distance: {chosen_alt.distance_km:.1f} km  "
+                f"Travel: {chosen_alt.travel_time_min} min  "
+                f"Crowd: {chosen_alt.predicted_crowd:.0%}",
+            )
 
             # Remove disrupted POIs from plan; inject chosen alternative
             for stop in pd.impacted_pois:
                 self.state.mark_skipped(stop)
 
             # Find or build a record for the chosen alternative
-            alt_rec = next(
-                (a for a in self._remaining if a.name == chosen_alt.name), None
-            )
+            alt_rec = self._remaining_by_name.get(chosen_alt.name)
             if alt_rec is None:
-                # Try full pool fetch as fallback
+                # Try full city pool as fallback (fetched once per session)
                 try:
-                    from modules.tool_usage.attraction_tool import AttractionTool
-                    all_recs = AttractionTool().fetch(self._city)
-                    alt_rec  = next(
-                        (a for a in all_recs if a.name == chosen_alt.name), None
-                    )
+                    if self._city_attractions_by_name is None:
+                        from modules.tool_usage.attraction_tool import AttractionTool
+                        all_recs = AttractionTool().fetch(self._city)
+                        self._city_attractions_by_name = {
+                            a.name: a for a in reversed(all_recs)
+                        }
+                    alt_rec = self._city_attractions_by_name.get(chosen_alt.name)
                 except Exception:
                     pass
 
             if alt_rec and alt_rec not in self._remaining:
-                self._remaining.append(alt_rec)
+                self._add_remaining(alt_rec)
                 self._condition_monitor.update_remaining(self._remaining)
 
             # Replan timing from current position (local repair, not full ACO)
@@ -759,66 +993,83 @@ class ReOptimizationSession:
         Print the structured disruption payload for user review.
         Displays rich AlternativeOption detail (distance, crowd, FTRM, history)
         and the mandatory 4-option decision menu.
+
+        The panel is assembled first and written with a single stdout write;
+        nothing is printed when the session is quiet (config.REOPT_QUIET).
         """
-        W   = 60
-        sep = "═" * W
+        if self._quiet:
+            return
+        sep = _RULE_HEAVY
 
         if pd._user_event_type:
             header_line = "✋  USER ACTION — AWAITING YOUR DECISION"
         else:
             header_line = "⚠  DISRUPTION DETECTED — AWAITING YOUR DECISION"
 
-        print(f"\n  {sep}")
-        print(f"  {header_line}")
-        print(f"  {sep}")
+        out: list[str] = []
+        add = out.append
+        add("")
+        add(f"  {sep}")
+        add(f"  {header_line}")
+        add(f"  {sep}")
 
         # ── Reason banner ────────────────────────────────────────────────────
         if pd._user_event_type:
-            print(f"  Action   : {pd._user_event_type}")
-        print(f"  Type     : {pd.disruption_type}")
-        print(f"  {pd.reason}")
+            add(f"  Action   : {pd._user_event_type}")
+        add(f"  Type     : {pd.disruption_type}")
+        add(f"  {pd.reason}")
         if pd.impacted_pois:
-            print(f"  Impacted : {', '.join(pd.impacted_pois)}")
+            add(f"  Impacted : {', '.join(pd.impacted_pois)}")
         if not pd._user_event_type:
-            print(f"  Value at risk (avg S_pti proxy): {pd.missed_value:.2f}")
+            add(f"  Value at risk (avg S_pti proxy): {pd.missed_value:.2f}")
 
         # ── Impact summary (user-action gate) ────────────────────────────────
         if pd.impact_summary:
-            print()
-            print(f"  IMPACT SUMMARY:")
+            add("")
+            add("  IMPACT SUMMARY:")
             for k, v in pd.impact_summary.items():
-                print(f"    {k:<26}: {v}")
+                add(f"    {k:<26}: {v}")
 
         # ── Rich alternatives ─────────────────────────────────────────────────
         rich = getattr(pd, "_rich_alternatives", [])
         if rich:
-            print()
-            print(f"  ALTERNATIVES (ranked by distance · crowd · FTRM · weather):")
+            add("")
+            add("  ALTERNATIVES (ranked by distance · crowd · FTRM · weather):")
             for alt in rich:
-                print(alt.describe(alt.rank))
+                add(alt.describe(alt.rank))
         elif pd.suggested_alternatives:
-            print()
-            print(f"  BEST ALTERNATIVES: {pd.suggested_alternatives}")
+            add("")
+            add(f"  BEST ALTERNATIVES: {pd.suggested_alternatives}")
 
         # ── 4-option decision menu ────────────────────────────────────────────
-        print()
-        print(f"  HOW WOULD YOU LIKE TO PROCEED?")
-        print(f"    [1] WAIT   — defer to a later time today (no schedule change)")
+        add("")
+        add("  HOW WOULD YOU LIKE TO PROCEED?")
+        add("    [1] WAIT   — defer to a later time today (no schedule change)")
         if rich:
-            print(f"    [2] REPLACE <index>  — replace with one of the alternatives above")
+            add("    [2] REPLACE <index>  — replace with one of the alternatives above")
         else:
-            print(f"    [2] REPLACE — replace with a suggested alternative")
-        print(f"    [3] SKIP   — remove this stop permanently")
-        print(f"    [4] KEEP   — proceed with original plan despite disruption")
-        print()
-        print(f"  resolve_pending(\"WAIT\")")
+            add("    [2] REPLACE — replace with a suggested alternative")
+        add("    [3] SKIP   — remove this stop permanently")
+        add("    [4] KEEP   — proceed with original plan despite disruption")
+        add("")
+        add("  resolve_pending(\"WAIT\")")
         if rich:
-            print(f"  resolve_pending(\"REPLACE\", action_index=<1–{len(rich)}>)")
+            add(f"  resolve_pending(\"REPLACE\", action_index=<1–{len(rich)}>)")
         else:
-            print(f"  resolve_pending(\"REPLACE\")")
-        print(f"  resolve_pending(\"SKIP\")")
-        print(f"  resolve_pending(\"KEEP\")")
-        print(f"  {sep}\n")
+            add("  resolve_pending(\"REPLACE\")")
+        add("  resolve_pending(\"SKIP\")")
+        add("  resolve_pending(\"KEEP\")")
+        add(f"  {sep}")
+        add("")
+        _emit(out)
+
+    def _print_gate_banner(self, *lines: str) -> None:
+        """Write a framed [Gate] decision banner in one stdout write."""
+        if self._quiet:
+            return
+        rule = f"  [Gate] {_RULE_HEAVY}"
+        body = "\n".join(f"  [Gate] {ln}" for ln in lines)
+        sys.stdout.write(f"\n{rule}\n{body}\n{rule}\n\n")
 
     # ── Empty day handler ─────────────────────────────────────────────────────
 
@@ -840,22 +1091,12 @@ class ReOptimizationSession:
             return  # day still has POIs
 
         # Build candidate pool
-        candidates = [
-            a for a in self._remaining
-            if a.name not in self.state.visited_stops
-            and a.name not in self.state.skipped_stops
-            and a.name not in self.state.deferred_stops
-        ]
+        candidates = self._active_pool()
         if not candidates:
             print("  [EmptyDay] Day has no POIs and the attraction pool is empty.")
             return
 
-        from datetime import time as _dtime
-        try:
-            _h, _m = map(int, self.state.current_time.split(":"))
-            _t_cur = _dtime(_h, _m)
-        except (ValueError, AttributeError):
-            _t_cur = _dtime(9, 0)
+        _t_cur = _clock_time(self.state.current_time)
 
         suggestions = self._alt_generator.generate(
             disrupted_poi_name="",
@@ -876,8 +1117,7 @@ class ReOptimizationSession:
             print("  [EmptyDay] Day has no POIs — no suitable alternatives found.")
             return
 
-        W = 60
-        sep = "─" * W
+        sep = _RULE_LIGHT
         print(f"\n  {sep}")
         print(f"  DAY IS EMPTY — here are top alternatives you can add:")
         print(f"  {sep}")
@@ -894,29 +1134,79 @@ class ReOptimizationSession:
         """Return name of the first non-visited/skipped/deferred stop in current plan."""
         if not self.state.current_day_plan:
             return ""
-        excluded = (self.state.visited_stops
-                    | self.state.skipped_stops
-                    | self.state.deferred_stops)
+        excluded = self.state.excluded_stops
         for rp in self.state.current_day_plan.route_points:
             if rp.name not in excluded:
                 return rp.name
         return ""
 
+    def _meta_remaining_minutes(self, meta: dict) -> int:
+        """
+        remaining_minutes from an EventHandler payload; computed from state
+        only when the handler did not already supply it.
+        """
+        rem = meta.get("remaining_minutes")
+        return self.state.remaining_minutes_today() if rem is None else rem
+
+    def _add_remaining(self, rec: AttractionRecord) -> None:
+        """Append rec to _remaining and keep the name / rating indexes in sync."""
+        self._remaining.append(rec)
+        self._remaining_by_name.setdefault(rec.name, rec)
+        self._spti_cache.clear()
+        self._remaining_version += 1
+        bisect.insort(self._remaining_sorted, rec, key=_neg_rating)
+
+    def _active_pool(self) -> list[AttractionRecord]:
+        """
+        _remaining minus visited / skipped / deferred stops.
+
+        Rebuilt only when _remaining or state.excluded_stops has changed since
+        the last call; callers must treat the returned list as read-only.
+        """
+        key = (self._remaining_version, self.state._excluded_version)
+        if key != self._active_key:
+            excluded = self.state.excluded_stops
+            self._active = [a for a in self._remaining if a.name not in excluded]
+            self._active_key = key
+        return self._active
+
+    def _remaining_coords(self) -> tuple | None:
+        """pool_coords(_remaining), rebuilt only when _remaining changes."""
+        version, coords = self._coords_memo
+        if version != self._remaining_version:
+            coords = pool_coords(self._remaining)
+            self._coords_memo = (self._remaining_version, coords)
+        return coords
+
     def _spti_proxy(self, name: str) -> float:
-        """Quick S_pti proxy = attraction.rating / 5.0, capped [0, 1]."""
-        rec = next((a for a in self._remaining if a.name == name), None)
-        if rec is None:
-            return 0.0
-        return min(1.0, max(0.0, rec.rating / 5.0))
+        """
+        Quick S_pti proxy = attraction.rating / 5.0, capped [0, 1].
+        Memoised in _spti_cache; cleared whenever _remaining changes.
+        """
+        v = self._spti_cache.get(name)
+        if v is not None:
+            return v
+        rec = self._remaining_by_name.get(name)
+        v = 0.0 if rec is None else min(1.0, max(0.0, rec.rating / 5.0))
+        self._spti_cache[name] = v
+        return v
 
     def _top_alternatives(self, exclude: list[str], n: int = 3) -> list[str]:
         """Top-n remaining stops by rating, excluding listed names."""
-        excluded_set = (set(exclude)
-                        | self.state.visited_stops
-                        | self.state.skipped_stops)
-        pool = [a for a in self._remaining if a.name not in excluded_set]
-        pool.sort(key=lambda a: a.rating, reverse=True)
-        return [a.name for a in pool[:n]]
+        out: list[str] = []
+        if n <= 0:
+            return out
+        # Test the state sets in place — copying their union would cost
+        # O(visited + skipped) per call, more than the early-exit walk below.
+        visited = self.state.visited_stops
+        skipped = self.state.skipped_stops
+        for a in self._remaining_sorted:
+            name = a.name
+            if name not in exclude and name not in visited and name not in skipped:
+                out.append(name)
+                if len(out) == n:
+                    break
+        return out
 
     def _build_user_action_pending(
         self,
@@ -953,172 +1243,171 @@ class ReOptimizationSession:
             proposed     = [APPLY_CHANGE, KEEP_AS_IS]
         """
         et = event_type.value
+        builder = self._USER_PENDING_BUILDERS.get(et)
+        if builder is None:
+            return self._pending_for_plan_change(et, payload)
+        return builder(self, et, payload)
+
+    def _pending_for_skip(self, et: str, payload: dict) -> "PendingDecision":
+        """USER_SKIP / USER_SKIP_CURRENT gate."""
+        stop = payload.get("stop_name", "") or self._next_unvisited_stop_name()
+        rec  = self._remaining_by_name.get(stop)
+        s    = self._spti_proxy(stop)
+        alts = self._top_alternatives([stop])
+        # getattr defaults also cover rec=None (stop not in the pool)
+        dur  = getattr(rec, "estimated_duration_minutes", 60)
+        cost = getattr(rec, "estimated_cost", 0.0)
+        return PendingDecision(
+            disruption_type    = "USER_ACTION",
+            impacted_pois      = [stop] if stop else [],
+            _reason            = (f"User requested skip of '{stop}' "
+                                  f"(S_pti proxy={s:.2f})"),
+            missed_value       = s,
+            proposed_actions   = [
+                ProposedAction("APPLY_CHANGE",  stop,
+                               {"op": "skip", "HC_pti": 1,
+                                "delta_Spti": round(-s, 3)}),
+                ProposedAction("DEFER_CHANGE",  stop,
+                               {"timing": "later today"}),
+                ProposedAction("KEEP_AS_IS",    stop, {}),
+            ],
+            suggested_alternatives = alts,
+            severity           = 0.0,
+            _user_event_type   = et,
+            _user_event_payload = payload,
+            impact_summary     = _impact_summary(
+                1, round(-s, 3),
+                f"-{dur} min (freed)", f"-{cost:.0f}",
+            ),
+        )
 
-        # ── USER_SKIP / USER_SKIP_CURRENT ────────────────────────────────────
-        if et in ("user_skip", "user_skip_current"):
-            stop = payload.get("stop_name", "") or self._next_unvisited_stop_name()
-            rec  = next((a for a in self._remaining if a.name == stop), None)
-            s    = self._spti_proxy(stop)
-            alts = self._top_alternatives([stop])
-            dur  = getattr(rec, "estimated_duration_minutes", 60) if rec else 60
-            cost = getattr(rec, "estimated_cost", 0.0) if rec else 0.0
-            return PendingDecision(
-                disruption_type    = "USER_ACTION",
-                impacted_pois      = [stop] if stop else [],
-                reason             = (f"User requested skip of '{stop}' "
-                                      f"(S_pti proxy={s:.2f})"),
-                missed_value       = s,
-                proposed_actions   = [
-                    ProposedAction("APPLY_CHANGE",  stop,
-                                   {"op": "skip", "HC_pti": 1,
-                                    "delta_Spti": round(-s, 3)}),
-                    ProposedAction("DEFER_CHANGE",  stop,
-                                   {"timing": "later today"}),
-                    ProposedAction("KEEP_AS_IS",    stop, {}),
-                ],
-                suggested_alternatives = alts,
-                severity           = 0.0,
-                _user_event_type   = et,
-                _user_event_payload = payload,
-                impact_summary     = {
-                    "feasibility_change":  1,
-                    "satisfaction_change": round(-s, 3),
-                    "time_change":         f"-{dur} min (freed)",
-                    "cost_change":         f"-{cost:.0f}",
-                },
-            )
-
-        # ── USER_DISLIKE_NEXT ─────────────────────────────────────────────────
-        if et == "user_dislike_next":
-            stop = self._next_unvisited_stop_name()
-            s    = self._spti_proxy(stop)
-            alts = self._top_alternatives([stop])
-            return PendingDecision(
-                disruption_type    = "USER_ACTION",
-                impacted_pois      = [stop] if stop else [],
-                reason             = (f"User dislikes next stop '{stop}' "
-                                      f"(S_pti proxy={s:.2f}) — show alternatives"),
-                missed_value       = s,
-                proposed_actions   = [
-                    ProposedAction("SUGGEST_ALTERNATIVES", stop,
-                                   {"op": "dislike_show_alts",
-                                    "delta_Spti": round(-s, 3)}),
-                    ProposedAction("KEEP_AS_IS", stop, {}),
-                ],
-                suggested_alternatives = alts,
-                severity           = 0.0,
-                _user_event_type   = et,
-                _user_event_payload = payload,
-                impact_summary     = {
-                    "feasibility_change":  1,
-                    "satisfaction_change": round(-s, 3),
-                    "time_change":         "0 min (no skip yet)",
-                    "cost_change":         "0",
-                },
-            )
+    def _pending_for_dislike_next(self, et: str, payload: dict) -> "PendingDecision":
+        """USER_DISLIKE_NEXT gate."""
+        stop = self._next_unvisited_stop_name()
+        s    = self._spti_proxy(stop)
+        alts = self._top_alternatives([stop])
+        return PendingDecision(
+            disruption_type    = "USER_ACTION",
+            impacted_pois      = [stop] if stop else [],
+            _reason            = (f"User dislikes next stop '{stop}' "
+                                  f"(S_pti proxy={s:.2f}) — show alternatives"),
+            missed_value       = s,
+            proposed_actions   = [
+                ProposedAction("SUGGEST_ALTERNATIVES", stop,
+                               {"op": "dislike_show_alts",
+                                "delta_Spti": round(-s, 3)}),
+                ProposedAction("KEEP_AS_IS", stop, {}),
+            ],
+            suggested_alternatives = alts,
+            severity           = 0.0,
+            _user_event_type   = et,
+            _user_event_payload = payload,
+            impact_summary     = _impact_summary(
+                1, round(-s, 3),
+                "0 min (no skip yet)", "0",
+            ),
+        )
 
-        # ── USER_REPLACE_POI ─────────────────────────────────────────────────
-        if et == "user_replace_poi":
-            replacement = payload.get("replacement_record")
-            orig_name   = self._next_unvisited_stop_name()
-            s_orig      = self._spti_proxy(orig_name)
-            s_rep       = min(1.0, max(0.0,
-                              getattr(replacement, "rating", 0.0) / 5.0)
-                          ) if replacement else 0.0
-            delta_s     = round(s_rep - s_orig, 3)
-            rep_name    = getattr(replacement, "name", "?") if replacement else "?"
-            orig_cost   = getattr(
-                next((a for a in self._remaining if a.name == orig_name), None),
-                "estimated_cost", 0.0)
-            rep_cost    = getattr(replacement, "estimated_cost", 0.0) if replacement else 0.0
-            orig_dur    = getattr(
-                next((a for a in self._remaining if a.name == orig_name), None),
-                "estimated_duration_minutes", 60)
-            rep_dur     = getattr(replacement, "estimated_duration_minutes", 60) if replacement else 60
-            # HC_pti proxy: replacement passes if HC_pti > 0 (rating > 0 heuristic)
-            hc_proxy    = 1 if s_rep > 0 else 0
-            return PendingDecision(
-                disruption_type    = "USER_ACTION",
-                impacted_pois      = [orig_name, rep_name],
-                reason             = (f"Replace '{orig_name}' → '{rep_name}' "
-                                      f"ΔSpti={delta_s:+.2f}  HC_pti={hc_proxy}"),
-                missed_value       = s_orig,
-                proposed_actions   = [
-                    ProposedAction("APPLY_CHANGE", orig_name,
-                                   {"replacement": rep_name,
-                                    "HC_pti": hc_proxy,
-                                    "delta_Spti": delta_s}),
-                    ProposedAction("KEEP_AS_IS",   orig_name, {}),
-                ],
-                suggested_alternatives = self._top_alternatives([orig_name, rep_name]),
-                severity           = 0.0,
-                _user_event_type   = et,
-                _user_event_payload = payload,
-                impact_summary     = {
-                    "feasibility_change":  hc_proxy,
-                    "satisfaction_change": delta_s,
-                    "time_change":    f"{rep_dur - orig_dur:+d} min",
-                    "cost_change":    f"{rep_cost - orig_cost:+.0f}",
-                },
-            )
+    def _pending_for_replace_poi(self, et: str, payload: dict) -> "PendingDecision":
+        """USER_REPLACE_POI gate."""
+        replacement = payload.get("replacement_record")
+        orig_name   = self._next_unvisited_stop_name()
+        s_orig      = self._spti_proxy(orig_name)
+        # getattr defaults also cover a missing replacement_record (None)
+        s_rep       = min(1.0, max(0.0, getattr(replacement, "rating", 0.0) / 5.0))
+        delta_s     = round(s_rep - s_orig, 3)
+        rep_name    = getattr(replacement, "name", "?")
+        orig_rec    = self._remaining_by_name.get(orig_name)
+        orig_cost   = getattr(orig_rec, "estimated_cost", 0.0)
+        rep_cost    = getattr(replacement, "estimated_cost", 0.0)
+        orig_dur    = getattr(orig_rec, "estimated_duration_minutes", 60)
+        rep_dur     = getattr(replacement, "estimated_duration_minutes", 60)
+        # HC_pti proxy: replacement passes if HC_pti > 0 (rating > 0 heuristic)
+        hc_proxy    = 1 if s_rep > 0 else 0
+        return PendingDecision(
+            disruption_type    = "USER_ACTION",
+            impacted_pois      = [orig_name, rep_name],
+            _reason            = (f"Replace '{orig_name}' → '{rep_name}' "
+                                  f"ΔSpti={delta_s:+.2f}  HC_pti={hc_proxy}"),
+            missed_value       = s_orig,
+            proposed_actions   = [
+                ProposedAction("APPLY_CHANGE", orig_name,
+                               {"replacement": rep_name,
+                                "HC_pti": hc_proxy,
+                                "delta_Spti": delta_s}),
+                ProposedAction("KEEP_AS_IS",   orig_name, {}),
+            ],
+            suggested_alternatives = self._top_alternatives([orig_name, rep_name]),
+            severity           = 0.0,
+            _user_event_type   = et,
+            _user_event_payload = payload,
+            impact_summary     = _impact_summary(
+                hc_proxy, delta_s,
+                f"{rep_dur - orig_dur:+d} min", f"{rep_cost - orig_cost:+.0f}",
+            ),
+        )
 
-        # ── USER_ADD_STOP ─────────────────────────────────────────────────────
-        if et == "user_add":
-            new_attr = payload.get("attraction") or payload.get("new_attraction")
-            if new_attr is None:
-                return PendingDecision(
-                    disruption_type="USER_ACTION", impacted_pois=[],
-                    reason="Add-stop request with no attraction record.",
-                    missed_value=0.0, proposed_actions=[], suggested_alternatives=[],
-                    severity=0.0, _user_event_type=et, _user_event_payload=payload,
-                )
-            name  = getattr(new_attr, "name", "?")
-            s_new = min(1.0, max(0.0, getattr(new_attr, "rating", 0.0) / 5.0))
-            dur   = getattr(new_attr, "estimated_duration_minutes", 60)
-            cost  = getattr(new_attr, "estimated_cost", 0.0)
+    def _pending_for_add_stop(self, et: str, payload: dict) -> "PendingDecision":
+        """USER_ADD_STOP gate."""
+        new_attr = payload.get("attraction") or payload.get("new_attraction")
+        if new_attr is None:
             return PendingDecision(
-                disruption_type    = "USER_ACTION",
-                impacted_pois      = [name],
-                reason             = (f"Add '{name}' to pool "
-                                      f"(S_pti proxy={s_new:.2f})"
-                                      f"  STi≈{dur} min  cost≈{cost:.0f}"),
-                missed_value       = 0.0,
-                proposed_actions   = [
-                    ProposedAction("APPLY_CHANGE", name,
-                                   {"op": "add_to_pool",
-                                    "delta_Spti": round(s_new, 3),
-                                    "STi": dur, "cost": cost}),
-                    ProposedAction("KEEP_AS_IS", name, {}),
-                ],
-                suggested_alternatives = [],
-                severity           = 0.0,
-                _user_event_type   = et,
-                _user_event_payload = payload,
-                impact_summary     = {
-                    "feasibility_change":  1,
-                    "satisfaction_change": round(s_new, 3),
-                    "time_change":         f"+{dur} min",
-                    "cost_change":         f"+{cost:.0f}",
-                },
+                disruption_type="USER_ACTION", impacted_pois=[],
+                _reason="Add-stop request with no attraction record.",
+                missed_value=0.0, proposed_actions=[], suggested_alternatives=[],
+                severity=0.0, _user_event_type=et, _user_event_payload=payload,
             )
+        name  = getattr(new_attr, "name", "?")
+        s_new = min(1.0, max(0.0, getattr(new_attr, "rating", 0.0) / 5.0))
+        dur   = getattr(new_attr, "estimated_duration_minutes", 60)
+        cost  = getattr(new_attr, "estimated_cost", 0.0)
+        return PendingDecision(
+            disruption_type    = "USER_ACTION",
+            impacted_pois      = [name],
+            _reason            = (f"Add '{name}' to pool "
+                                  f"(S_pti proxy={s_new:.2f})"
+                                  f"  STi≈{dur} min  cost≈{cost:.0f}"),
+            missed_value       = 0.0,
+            proposed_actions   = [
+                ProposedAction("APPLY_CHANGE", name,
+                               {"op": "add_to_pool",
+                                "delta_Spti": round(s_new, 3),
+                                "STi": dur, "cost": cost}),
+                ProposedAction("KEEP_AS_IS", name, {}),
+            ],
+            suggested_alternatives = [],
+            severity           = 0.0,
+            _user_event_type   = et,
+            _user_event_payload = payload,
+            impact_summary     = _impact_summary(
+                1, round(s_new, 3),
+                f"+{dur} min", f"+{cost:.0f}",
+            ),
+        )
 
-        # ── USER_PREFERENCE_CHANGE / USER_REORDER / USER_MANUAL_REOPT ─────────
+    def _pending_for_plan_change(self, et: str, payload: dict) -> "PendingDecision":
+        """USER_PREFERENCE_CHANGE / USER_REORDER / USER_MANUAL_REOPT gate (default)."""
         field = payload.get("field", "")
         value = payload.get("value", "")
-        reason_text = {
-            "user_pref":          (f"Preference change: {field} → {value}"),
-            "user_reorder":       (f"Reorder request: {payload.get('preferred_order', [])}"),
-            "user_manual_reopt":  (payload.get("reason", "Manual re-optimization requested")),
-        }.get(et, f"User action: {et}")
-        remaining_labels = [
-            a.name for a in self._remaining
-            if a.name not in self.state.visited_stops
-            and a.name not in self.state.skipped_stops
-        ][:5]
+        if et == "user_pref":
+            reason_text = f"Preference change: {field} → {value}"
+        elif et == "user_reorder":
+            reason_text = f"Reorder request: {payload.get('preferred_order', [])}"
+        elif et == "user_manual_reopt":
+            reason_text = payload.get("reason", "Manual re-optimization requested")
+        else:
+            reason_text = f"User action: {et}"
+        visited = self.state.visited_stops
+        skipped = self.state.skipped_stops
+        remaining_labels = list(islice(
+            (a.name for a in self._remaining
+             if a.name not in visited and a.name not in skipped),
+            5,
+        ))
         return PendingDecision(
             disruption_type    = "USER_ACTION",
             impacted_pois      = remaining_labels,
-            reason             = reason_text,
+            _reason            = reason_text,
             missed_value       = 0.0,
             proposed_actions   = [
                 ProposedAction("APPLY_CHANGE", "all_remaining",
@@ -1129,14 +1418,22 @@ class ReOptimizationSession:
             severity           = 0.0,
             _user_event_type   = et,
             _user_event_payload = payload,
-            impact_summary     = {
-                "feasibility_change":  1,
-                "satisfaction_change": "recomputed after change",
-                "time_change":         "recomputed",
-                "cost_change":         "unchanged",
-            },
+            impact_summary     = _impact_summary(
+                1, "recomputed after change",
+                "recomputed", "unchanged",
+            ),
         )
 
+    # EventType.value → gate builder (plain functions, called with self);
+    # anything else falls through to _pending_for_plan_change.
+    _USER_PENDING_BUILDERS = {
+        "user_skip":          _pending_for_skip,
+        "user_skip_current":  _pending_for_skip,
+        "user_dislike_next":  _pending_for_dislike_next,
+        "user_replace_poi":   _pending_for_replace_poi,
+        "user_add":           _pending_for_add_stop,
+    }
+
     def _execute_user_event(
         self,
         event_type: "EventType",
@@ -1152,10 +1449,9 @@ class ReOptimizationSession:
         # Apply preference change to constraints before replanning
         if (event_type == EventType.USER_PREFERENCE_CHANGE
                 and decision.metadata.get("sc_update")):
-            for f_name, f_val in decision.metadata["sc_update"].items():
-                self.constraints = self._partial_replanner.apply_preference_update(
-                    self.constraints, f_name, f_val
-                )
+            self.constraints = self._partial_replanner.apply_preference_updates(
+                self.constraints, decision.metadata["sc_update"]
+            )
             self._condition_monitor = ConditionMonitor(
                 self.constraints.soft, self._remaining, total_days=self.total_days
             )
@@ -1166,23 +1462,17 @@ class ReOptimizationSession:
                 and decision.metadata.get("new_attraction")):
             new_attr = decision.metadata["new_attraction"]
             if new_attr not in self._remaining:
-                self._remaining.append(new_attr)
+                self._add_remaining(new_attr)
             self._condition_monitor.update_remaining(self._remaining)
 
+        handler = self._decision_handler(decision)
+        if handler is not None:
+            return handler(decision)
         if not decision.should_replan:
-            if decision.metadata.get("crowd_action") == "inform_user":
-                return self._handle_crowd_action(decision)
-            if decision.metadata.get("user_edit_action"):
-                return self._handle_user_edit_action(decision)
             print(f"  [Session] Event '{event_type.value}': no replan needed. "
                   f"({decision.reason})")
             return None
 
-        if decision.metadata.get("crowd_action"):
-            return self._handle_crowd_action(decision)
-        if decision.metadata.get("user_edit_action"):
-            return self._handle_user_edit_action(decision)
-
         # Rule 9: preference change — update scoring weights only, no replan
         if event_type == EventType.USER_PREFERENCE_CHANGE:
             field = payload.get("field", "")
@@ -1195,6 +1485,24 @@ class ReOptimizationSession:
 
         return self._do_replan(reasons=[decision.reason])
 
+    def _decision_handler(self, decision: "ReplanDecision"):
+        """
+        Specialised handler for an EventHandler decision, or None when it
+        takes the default path (no-replan message / _do_replan).
+
+          crowd_action      → _handle_crowd_action (inform_user arrives with
+                              should_replan=False but still needs the advisory)
+          user_edit_action  → _handle_user_edit_action (dislike_next is
+                              advisory-only)
+        """
+        meta  = decision.metadata
+        crowd = meta.get("crowd_action")
+        if crowd and (decision.should_replan or crowd == "inform_user"):
+            return self._handle_crowd_action
+        if meta.get("user_edit_action"):
+            return self._handle_user_edit_action
+        return None
+
     # ── Direct event API ─────────────────────────────────────────────────────
 
     def event(
@@ -1216,7 +1524,7 @@ class ReOptimizationSession:
             New DayPlan if a non-gated event triggered a replan; else None.
         """
         # ── APPROVAL GATE: user-triggered itinerary modifications ─────────────
-        if event_type.value in _USER_GATE_EVENTS:
+        if event_type in _USER_GATE_EVENTS:
             if self.pending_decision is not None:
                 print("  [Gate] A decision is already pending — call "
                       "resolve_pending() first.")
@@ -1244,25 +1552,14 @@ class ReOptimizationSession:
         # ── Non-gated events: route directly ─────────────────────────────────
         decision = self._event_handler.handle(event_type, payload, self.state)
 
+        handler = self._decision_handler(decision)
+        if handler is not None:
+            return handler(decision)
         if not decision.should_replan:
-            # Check for crowd inform_user
-            if decision.metadata.get("crowd_action") == "inform_user":
-                return self._handle_crowd_action(decision)
-            # Check for user_edit advisory (dislike_next — no replan, just print)
-            if decision.metadata.get("user_edit_action"):
-                return self._handle_user_edit_action(decision)
             print(f"  [Session] Event '{event_type.value}': no replan needed. "
                   f"({decision.reason})")
             return None
 
-        # Route crowd events through the 3-strategy handler
-        if decision.metadata.get("crowd_action"):
-            return self._handle_crowd_action(decision)
-
-        # Route user-edit events through the edit handler
-        if decision.metadata.get("user_edit_action"):
-            return self._handle_user_edit_action(decision)
-
         return self._do_replan(reasons=[decision.reason])
     # ── Crowd rescheduling dispatcher ──────────────────────────────────────────
 
@@ -1283,6 +1580,11 @@ class ReOptimizationSession:
         target_day   = decision.metadata.get("target_day",   None)
 
         # ── Build advisory (historical importance + ranked alternatives) ─────
+        if self._next_stop_fetch is not None and stop == self._prefetched_name:
+            try:
+                self._next_stop_fetch.result()   # insight cache now warm
+            except Exception:
+                pass                             # build() resolves it again
         advisory = self._crowd_advisory.build(
             crowded_stop      = stop,
             crowd_level       = crowd_level,
@@ -1342,76 +1644,59 @@ class ReOptimizationSession:
         header: str = "CROWD ALERT",
     ) -> None:
         """Print the formatted crowd advisory panel to the terminal."""
-        W   = 64
-        sep = "-" * W
-
-        print(f"\n  [Crowd] {sep}")
-        print(f"  {header}: '{advisory.crowded_stop}'")
-        print(f"  Live crowd: {advisory.crowd_level:.0%}  |  "
-              f"Your tolerance: {advisory.threshold:.0%}")
-        print(f"  {sep}")
+        if self._quiet:
+            return
+        sep = _PANEL_SEP
+        out: list[str] = [_CROWD_HEAD.format(
+            header=header, stop=advisory.crowded_stop,
+            level=advisory.crowd_level, thr=advisory.threshold,
+        )]
+        add = out.append
 
         # WHAT YOU WILL MISS — only when permanent loss is possible
         if advisory.strategy == "inform_user":
-            print(f"  WHAT YOU WILL MISS IF YOU SKIP:")
-            for ln in advisory.insight.format_for_display(W - 4):
-                print(f"    {ln.strip()}")
-            print()
+            add(f"  WHAT YOU WILL MISS IF YOU SKIP:")
+            for ln in advisory.insight.format_for_display(_PANEL_WRAP):
+                add(f"    {ln.strip()}")
+            add("")
 
         # BEST ALTERNATIVES — always shown
         if advisory.alternatives:
-            print(f"  BEST ALTERNATIVES RIGHT NOW (ranked by FTRM score):")
+            add(f"  BEST ALTERNATIVES RIGHT NOW (ranked by FTRM score):")
             for i, alt in enumerate(advisory.alternatives, 1):
                 a = alt.attraction
-                print(f"    {i}. {a.name}")
-                print(f"       Category : {a.category}  |  Rating: {a.rating:.1f}")
-                print(f"       Why good : {alt.why_suitable}")
+                add(f"    {i}. {a.name}")
+                add(f"       Category : {a.category}  |  Rating: {a.rating:.1f}")
+                add(f"       Why good : {alt.why_suitable}")
                 if a.historical_importance:
-                    teaser = a.historical_importance.split(".")[0] + "."
-                    words: list[str] = teaser.split()
-                    cur: list[str] = []
-                    tlines: list[str] = []
-                    for word in words:
-                        if sum(len(w) + 1 for w in cur) + len(word) > W - 16:
-                            tlines.append(" ".join(cur))
-                            cur = [word]
-                        else:
-                            cur.append(word)
-                    if cur:
-                        tlines.append(" ".join(cur))
-                    print(f"       Context  : {tlines[0]}")
+                    tlines = _teaser_lines(a.historical_importance)
+                    add(f"       Context  : {tlines[0]}")
                     for tl in tlines[1:]:
-                        print(f"                  {tl}")
-                print()
+                        add(f"                  {tl}")
+                add("")
         else:
-            print(f"  (No alternatives available under your constraints.)")
-            print()
+            add(f"  (No alternatives available under your constraints.)")
+            add("")
 
         # SYSTEM DECISION
-        print(f"  SYSTEM DECISION:")
-        words2 = advisory.strategy_msg.split()
-        cur2: list[str] = []
-        for word in words2:
-            if sum(len(w) + 1 for w in cur2) + len(word) > W - 4:
-                print(f"    " + " ".join(cur2))
-                cur2 = [word]
-            else:
-                cur2.append(word)
-        if cur2:
-            print(f"    " + " ".join(cur2))
-        print()
+        add(f"  SYSTEM DECISION:")
+        for line in _wrap_lines(advisory.strategy_msg, _PANEL_WRAP):
+            add(f"    {line}")
+        add("")
 
         # YOUR CHOICE — only for inform_user / Strategy 3
         if advisory.pending_decision:
-            print(f"  YOUR CHOICE:")
-            print(f"    a) Visit '{advisory.crowded_stop}' despite the crowds")
-            print(f"       (continue as planned — no action needed)")
-            print(f"    b) Skip permanently:")
-            print(f"       session.event(EventType.USER_SKIP,")
-            print(f"                     {{\"stop_name\": \"{advisory.crowded_stop}\"}})")
-            print()
-
-        print(f"  {sep}\n")
+            add(f"  YOUR CHOICE:")
+            add(f"    a) Visit '{advisory.crowded_stop}' despite the crowds")
+            add(f"       (continue as planned — no action needed)")
+            add(f"    b) Skip permanently:")
+            add(f"       session.event(EventType.USER_SKIP,")
+            add(f"                     {{\"stop_name\": \"{advisory.crowded_stop}\"}})")
+            add("")
+
+        add(f"  {sep}")
+        add("")
+        _emit(out)
 
     # ── User-edit dispatcher ──────────────────────────────────────────────────
 
@@ -1428,7 +1713,7 @@ class ReOptimizationSession:
         meta   = decision.metadata
         action = meta.get("user_edit_action", "")
 
-        rem    = meta.get("remaining_minutes", self.state.remaining_minutes_today())
+        rem    = self._meta_remaining_minutes(meta)
         cur_lat  = meta.get("current_lat",  self.state.current_lat)
         cur_lon  = meta.get("current_lon",  self.state.current_lon)
         cur_time = meta.get("current_time", self.state.current_time)
@@ -1461,10 +1746,9 @@ class ReOptimizationSession:
                 print("  [UserEdit] REPLACE_POI: no replacement_record in payload.")
                 return None
 
-            budget_rem = meta.get(
-                "budget_remaining",
-                self.state.remaining_budget(self.budget),
-            )
+            budget_rem = meta.get("budget_remaining")
+            if budget_rem is None:
+                budget_rem = self.state.remaining_budget(self.budget)
             result = self._user_edit.replace_poi(
                 current_plan        = self.state.current_day_plan,
                 replacement_record  = record,
@@ -1545,35 +1829,42 @@ class ReOptimizationSession:
         header: str = "DISLIKE ADVISORY",
     ) -> None:
         """Print the dislike-next-stop advisory panel."""
-        W   = 64
-        sep = "-" * W
-        print(f"\n  [Edit] {sep}")
-        print(f"  {header}")
-        print(f"  You disliked: '{result.disliked_stop}'  "
-              f"(S_pti={result.current_S_pti:.2f})")
-        print(f"  {sep}")
+        if self._quiet:
+            return
+        sep = _PANEL_SEP
+        out: list[str] = ["", f"  [Edit] {sep}"]
+        add = out.append
+        add(f"  {header}")
+        add(f"  You disliked: '{result.disliked_stop}'  "
+            f"(S_pti={result.current_S_pti:.2f})")
+        add(f"  {sep}")
 
         if result.no_alternatives:
-            print("  No alternatives available under your constraints.")
-            print(f"  {sep}\n")
+            add("  No alternatives available under your constraints.")
+            add(f"  {sep}")
+            add("")
+            _emit(out)
             return
 
-        print(f"  BEST ALTERNATIVES (ranked by FTRM score):")
+        add(f"  BEST ALTERNATIVES (ranked by FTRM score):")
         for opt in result.alternatives:
             a = opt.attraction
-            print(f"    {opt.rank}. {a.name}")
-            print(f"       Category  : {a.category}  |  Rating: {a.rating:.1f}")
-            print(f"       S_pti={opt.S_pti:.2f}  Dij={opt.Dij_from_current:.1f} min"
-                  f"  η={opt.eta_ij:.3f}")
-            print(f"       Suitability: {opt.why_suitable}")
-            print()
-
-        print(f"  TO REPLACE, fire:")
+            add(f"    {opt.rank}. {a.name}")
+            add(f"       Category  : {a.category}  |  Rating: {a.rating:.1f}")
+            add(f"       S_pti={opt.S_pti:.2f}  Dij={opt.Dij_from_current:.1f} min"
+                f"  η={opt.eta_ij:.3f}")
+            add(f"       Suitability: {opt.why_suitable}")
+            add("")
+
+        add(f"  TO REPLACE, fire:")
         if result.alternatives:
-            print(f"    session.event(EventType.USER_REPLACE_POI, {{")
-            print(f"        \"replacement_record\": <chosen AttractionRecord>,")
-            print(f"    }})")
-        print(f"\n  {sep}\n")
+            add(f"    session.event(EventType.USER_REPLACE_POI, {{")
+            add(f"        \"replacement_record\": <chosen AttractionRecord>,")
+            add(f"    }})")
+        add("")
+        add(f"  {sep}")
+        add("")
+        _emit(out)
 
     def _print_replace_result(
         self,
@@ -1581,24 +1872,29 @@ class ReOptimizationSession:
         header: str = "POI REPLACEMENT",
     ) -> None:
         """Print the replace-POI result panel."""
-        W   = 64
-        sep = "-" * W
-        print(f"\n  [Edit] {sep}")
-        print(f"  {header}: '{result.original_stop}' → '{result.replacement_stop}'")
-        print(f"  {sep}")
+        if self._quiet:
+            return
+        sep = _PANEL_SEP
+        out: list[str] = ["", f"  [Edit] {sep}"]
+        add = out.append
+        add(f"  {header}: '{result.original_stop}' → '{result.replacement_stop}'")
+        add(f"  {sep}")
 
         if result.accepted:
-            print(f"  ✓  ACCEPTED")
+            add(f"  ✓  ACCEPTED")
             delta_sign = "+" if result.budget_delta >= 0 else ""
-            print(f"     Budget delta  : {delta_sign}{result.budget_delta:.2f}")
+            add(f"     Budget delta  : {delta_sign}{result.budget_delta:.2f}")
             if result.updated_plan:
                 stops = [rp.name for rp in result.updated_plan.route_points]
-                print(f"     Updated plan  : {stops}")
+                add(f"     Updated plan  : {stops}")
         else:
-            print(f"  ✗  REJECTED")
-            print(f"     Reason: {result.rejection_reason}")
+            add(f"  ✗  REJECTED")
+            add(f"     Reason: {result.rejection_reason}")
 
-        print(f"\n  {sep}\n")
+        add("")
+        add(f"  {sep}")
+        add("")
+        _emit(out)
 
     # ── Weather disruption dispatcher ─────────────────────────────────────────
 
@@ -1618,7 +1914,7 @@ class ReOptimizationSession:
         threshold = meta.get("threshold", 0.5)
         cur_lat   = meta.get("current_lat",       self.state.current_lat)
         cur_lon   = meta.get("current_lon",       self.state.current_lon)
-        rem_min   = meta.get("remaining_minutes", self.state.remaining_minutes_today())
+        rem_min   = self._meta_remaining_minutes(meta)
 
         advisory = self._weather_advisor.classify(
             condition         = condition,
@@ -1629,6 +1925,7 @@ class ReOptimizationSession:
             current_lon       = cur_lon,
             remaining_minutes = rem_min,
             top_n             = 3,
+            coords            = self._remaining_coords(),
         )
 
         # Defer all blocked stops so PartialReplanner excludes them
@@ -1647,15 +1944,15 @@ class ReOptimizationSession:
             accepted   = True,
             alternatives = [a.attraction.name for a in advisory.alternatives],
         )
-        for imp in advisory.blocked_stops:
-            if advisory.alternatives:
-                self._disruption_memory.record_replacement(
-                    original    = imp.attraction.name,
-                    replacement = advisory.alternatives[0].attraction.name,
-                    reason      = "weather",
-                    S_orig      = advisory.alternatives[0].S_pti * 0.0,
-                    S_rep       = advisory.alternatives[0].S_pti,
-                )
+        if advisory.alternatives and advisory.blocked_stops:
+            best = advisory.alternatives[0]
+            self._disruption_memory.record_replacements(
+                originals   = [(imp.attraction.name, 0.0)
+                               for imp in advisory.blocked_stops],
+                replacement = best.attraction.name,
+                reason      = "weather",
+                S_rep       = best.S_pti,
+            )
 
         # Rule 6: ≥3 blocked POIs → full PartialReplanner; else LocalRepair
         blocked_count = len(advisory.blocked_stops)
@@ -1681,51 +1978,47 @@ class ReOptimizationSession:
         header: str = "WEATHER DISRUPTION",
     ) -> None:
         """Print the weather advisory panel."""
-        W   = 64
-        sep = "-" * W
-        print(f"\n  [Weather] {sep}")
-        print(f"  {header}: '{advisory.condition}'")
-        print(f"  Severity: {advisory.severity:.0%}  |  "
-              f"Threshold: {advisory.threshold:.0%}")
-        print(f"  {sep}")
+        if self._quiet:
+            return
+        sep = _PANEL_SEP
+        out: list[str] = [_WEATHER_HEAD.format(
+            header=header, cond=advisory.condition,
+            sev=advisory.severity, thr=advisory.threshold,
+        )]
+        add = out.append
 
         if advisory.blocked_stops:
-            print(f"  BLOCKED OUTDOOR STOPS (HC_pti = 0 — unsafe to visit):")
+            add(f"  BLOCKED OUTDOOR STOPS (HC_pti = 0 — unsafe to visit):")
             for imp in advisory.blocked_stops:
-                print(f"    \u2713 {imp.attraction.name}  [{imp.attraction.category}]")
-                print(f"      {imp.reason}")
-            print()
+                add(f"    \u2713 {imp.attraction.name}  [{imp.attraction.category}]")
+                add(f"      {imp.reason}")
+            add("")
 
         if advisory.deferred_stops:
-            print(f"  DEFERRED RISKY STOPS (duration reduced ×0.75):")
+            add(f"  DEFERRED RISKY STOPS (duration reduced ×0.75):")
             for imp in advisory.deferred_stops:
                 adj = advisory.duration_adjustments.get(imp.attraction.name, "?")
-                print(f"    ~ {imp.attraction.name}  [{imp.attraction.category}]"
-                      f"  → {adj} min")
-            print()
+                add(f"    ~ {imp.attraction.name}  [{imp.attraction.category}]"
+                    f"  → {adj} min")
+            add("")
 
         if advisory.alternatives:
-            print(f"  INDOOR ALTERNATIVES (ranked by \u03b7_ij = S_pti / Dij):")
+            add(f"  INDOOR ALTERNATIVES (ranked by \u03b7_ij = S_pti / Dij):")
             for i, alt in enumerate(advisory.alternatives, 1):
                 a = alt.attraction
-                print(f"    {i}. {a.name}")
-                print(f"       S_pti={alt.S_pti:.2f}  Dij={alt.Dij_new:.1f} min"
-                      f"  \u03b7={alt.eta_ij:.3f}")
-                print(f"       {alt.why_suitable}")
-            print()
-
-        print(f"  SYSTEM DECISION:")
-        words = advisory.strategy_msg.split()
-        cur: list[str] = []
-        for word in words:
-            if sum(len(w) + 1 for w in cur) + len(word) > W - 4:
-                print(f"    " + " ".join(cur))
-                cur = [word]
-            else:
-                cur.append(word)
-        if cur:
-            print(f"    " + " ".join(cur))
-        print(f"\n  {sep}\n")
+                add(f"    {i}. {a.name}")
+                add(f"       S_pti={alt.S_pti:.2f}  Dij={alt.Dij_new:.1f} min"
+                    f"  \u03b7={alt.eta_ij:.3f}")
+                add(f"       {alt.why_suitable}")
+            add("")
+
+        add(f"  SYSTEM DECISION:")
+        for line in _wrap_lines(advisory.strategy_msg, _PANEL_WRAP):
+            add(f"    {line}")
+        add("")
+        add(f"  {sep}")
+        add("")
+        _emit(out)
 
     # ── Traffic disruption dispatcher ─────────────────────────────────────────
 
@@ -1745,7 +2038,7 @@ class ReOptimizationSession:
         delay_minutes = meta.get("delay_minutes",       0)
         cur_lat       = meta.get("current_lat",  self.state.current_lat)
         cur_lon       = meta.get("current_lon",  self.state.current_lon)
-        rem_min       = meta.get("remaining_minutes", self.state.remaining_minutes_today())
+        rem_min       = self._meta_remaining_minutes(meta)
 
         advisory = self._traffic_advisor.assess(
             traffic_level     = traffic_level,
@@ -1757,6 +2050,7 @@ class ReOptimizationSession:
             current_lon       = cur_lon,
             remaining_minutes = rem_min,
             top_n             = 3,
+            coords            = self._remaining_coords(),
         )
 
         # Defer high-priority infeasible stops
@@ -1775,15 +2069,15 @@ class ReOptimizationSession:
             replaced      = [f.attraction.name for f in advisory.replaced_stops],
             accepted      = True,
         )
-        for fi in advisory.replaced_stops:
-            if advisory.alternatives:
-                self._disruption_memory.record_replacement(
-                    original    = fi.attraction.name,
-                    replacement = advisory.alternatives[0].attraction.name,
-                    reason      = "traffic",
-                    S_orig      = fi.S_pti,
-                    S_rep       = advisory.alternatives[0].S_pti,
-                )
+        if advisory.alternatives and advisory.replaced_stops:
+            best = advisory.alternatives[0]
+            self._disruption_memory.record_replacements(
+                originals   = [(fi.attraction.name, fi.S_pti)
+                               for fi in advisory.replaced_stops],
+                replacement = best.attraction.name,
+                reason      = "traffic",
+                S_rep       = best.S_pti,
+            )
 
         # Rule 6: ≥3 affected stops → full PartialReplanner; else LocalRepair
         affected_count = len(advisory.deferred_stops) + len(advisory.replaced_stops)
@@ -1810,56 +2104,51 @@ class ReOptimizationSession:
         header: str = "TRAFFIC DISRUPTION",
     ) -> None:
         """Print the traffic advisory panel."""
-        W   = 64
-        sep = "-" * W
-        print(f"\n  [Traffic] {sep}")
-        print(f"  {header}")
-        print(f"  Traffic: {advisory.traffic_level:.0%}  |  "
-              f"Threshold: {advisory.threshold:.0%}  |  "
-              f"Delay factor: \u00d7{advisory.delay_factor:.1f}")
-        print(f"  {sep}")
+        if self._quiet:
+            return
+        sep = _PANEL_SEP
+        out: list[str] = [_TRAFFIC_HEAD.format(
+            header=header, level=advisory.traffic_level,
+            thr=advisory.threshold, factor=advisory.delay_factor,
+        )]
+        add = out.append
 
         if advisory.deferred_stops:
-            print(f"  DEFERRED (high-priority, S_pti \u2265 threshold — kept for later):")
+            add(f"  DEFERRED (high-priority, S_pti \u2265 threshold — kept for later):")
             for fi in advisory.deferred_stops:
-                print(f"    ~ {fi.attraction.name}  "
-                      f"Dij_new={fi.Dij_new:.1f} min  S={fi.S_pti:.2f}")
-            print()
+                add(f"    ~ {fi.attraction.name}  "
+                    f"Dij_new={fi.Dij_new:.1f} min  S={fi.S_pti:.2f}")
+            add("")
 
         if advisory.replaced_stops:
-            print(f"  REPLACED (low-priority, S_pti < threshold):")
+            add(f"  REPLACED (low-priority, S_pti < threshold):")
             for fi in advisory.replaced_stops:
-                print(f"    \u2715 {fi.attraction.name}  "
-                      f"Dij_new={fi.Dij_new:.1f} min  S={fi.S_pti:.2f}")
-            print()
+                add(f"    \u2715 {fi.attraction.name}  "
+                    f"Dij_new={fi.Dij_new:.1f} min  S={fi.S_pti:.2f}")
+            add("")
 
         if advisory.alternatives:
-            print(f"  NEARBY ALTERNATIVES (ranked by \u03b7_ij = S_pti / Dij_new):")
+            add(f"  NEARBY ALTERNATIVES (ranked by \u03b7_ij = S_pti / Dij_new):")
             for i, alt in enumerate(advisory.alternatives, 1):
                 a = alt.attraction
                 clustered = "\u2022 CLUSTERED" if alt.is_clustered else ""
-                print(f"    {i}. {a.name}  {clustered}")
-                print(f"       S_pti={alt.S_pti:.2f}  Dij_new={alt.Dij_new:.1f} min"
-                      f"  \u03b7={alt.eta_ij_new:.3f}")
-                print(f"       {alt.why_suitable}")
-            print()
+                add(f"    {i}. {a.name}  {clustered}")
+                add(f"       S_pti={alt.S_pti:.2f}  Dij_new={alt.Dij_new:.1f} min"
+                    f"  \u03b7={alt.eta_ij_new:.3f}")
+                add(f"       {alt.why_suitable}")
+            add("")
 
         if advisory.start_time_delay_minutes > 0:
-            print(f"  START-TIME ADJUSTMENT: +{advisory.start_time_delay_minutes} min")
-            print()
-
-        print(f"  SYSTEM DECISION:")
-        words = advisory.strategy_msg.split()
-        cur: list[str] = []
-        for word in words:
-            if sum(len(w) + 1 for w in cur) + len(word) > W - 4:
-                print(f"    " + " ".join(cur))
-                cur = [word]
-            else:
-                cur.append(word)
-        if cur:
-            print(f"    " + " ".join(cur))
-        print(f"\n  {sep}\n")
+            add(f"  START-TIME ADJUSTMENT: +{advisory.start_time_delay_minutes} min")
+            add("")
+
+        add(f"  SYSTEM DECISION:")
+        for line in _wrap_lines(advisory.strategy_msg, _PANEL_WRAP):
+            add(f"    {line}")
+        add("")
+        add(f"  {sep}")
+        add("")
+        _emit(out)
 
     # ── Hunger / Fatigue disruption handlers ─────────────────────────────────
 
@@ -1879,7 +2168,7 @@ class ReOptimizationSession:
             cur_lat           = self.state.current_lat,
             cur_lon           = self.state.current_lon,
             remaining_minutes = self.state.remaining_minutes_today(),
-            budget_per_meal   = self.budget.Restaurants / max(self.total_days, 1),
+            budget_per_meal   = self._meal_budget_per_day,
         )
         # Print advisory panel
         self._hf_advisor.print_hunger_advisory(advisory)
@@ -1913,13 +2202,13 @@ class ReOptimizationSession:
         # Determine next planned stop name for the advisory
         next_stop = ""
         if self.state.current_day_plan and self.state.current_day_plan.route_points:
-            remaining_rp = [
-                rp for rp in self.state.current_day_plan.route_points
-                if rp.name not in self.state.visited_stops
-                and rp.name not in self.state.skipped_stops
-            ]
-            if remaining_rp:
-                next_stop = remaining_rp[0].name
+            visited = self.state.visited_stops
+            skipped = self.state.skipped_stops
+            next_stop = next(
+                (rp.name for rp in self.state.current_day_plan.route_points
+                 if rp.name not in visited and rp.name not in skipped),
+                "",
+            )
 
         advisory = self._hf_advisor.build_fatigue_advisory(
             state     = self.state,
@@ -2031,7 +2320,7 @@ class ReOptimizationSession:
         })
 
         # ── §7 OUTPUT: print strategy, modified elements, invariant confirmation
-        sep = "─" * 60
+        sep = _RULE_LIGHT
         print(f"\n  {sep}")
         print(f"  RE-OPTIMIZED DAY {self.state.current_day} — timetable after disruption")
         print(f"  Strategy: {repair_result.strategy_used}")
@@ -2065,39 +2354,49 @@ class ReOptimizationSession:
     ) -> DayPlan:
         """
         Invoke PartialReplanner and update session state with new plan.
+        The [Replan] header and timetable are skipped when the session is quiet.
         """
-        display_reason = " | ".join(reasons)
-        print(f"\n  [Replan] Triggered: {display_reason}")
-        print(f"  [Replan] Position {self.state.current_lat:.4f},{self.state.current_lon:.4f}"
-              f" | Time {self.state.current_time} "
-              f"| Remaining {self.state.remaining_minutes_today()} min")
+        state = self.state
+        if not self._quiet:
+            reason = reasons[0] if len(reasons) == 1 else " | ".join(reasons)
+            sys.stdout.write(
+                f"\n  [Replan] Triggered: {reason}\n"
+                f"  [Replan] Position {state.current_lat:.4f},{state.current_lon:.4f}"
+                f" | Time {state.current_time} "
+                f"| Remaining {state.remaining_minutes_today()} min\n"
+            )
 
         new_plan = self._partial_replanner.replan(
             state=self.state,
             remaining_attractions=self._remaining,
             constraints=self.constraints,
             deprioritize_outdoor=deprioritize_outdoor,
+            pool_version=self._remaining_version,
         )
 
         # Update remaining pool (remove newly planned stops so they aren't double-counted)
         self.state.current_day_plan = new_plan
         self.state.replan_pending = False
 
-        planned_names = {rp.name for rp in new_plan.route_points}
+        stop_names = [rp.name for rp in new_plan.route_points]
         self.replan_history.append({
             "time": self.state.current_time,
             "reasons": reasons,
-            "new_stops": list(planned_names),
+            "new_stops": stop_names,
         })
-
-        stop_names = [rp.name for rp in new_plan.route_points]
-        print(f"  [Replan] New plan ({len(stop_names)} stops): {stop_names}")
+        if self._quiet:
+            return new_plan
 
         # ── Formatted timetable for the replanned day ─────────────────────────
-        sep = "─" * 60
-        print(f"\n  {'─' * 60}")
-        print(f"  RE-OPTIMIZED DAY {self.state.current_day} — timetable after disruption")
-        print(f"  {sep}")
+        sep = _RULE_LIGHT
+        out: list[str] = [
+            f"  [Replan] New plan ({len(stop_names)} stops): {stop_names}",
+            "",
+            f"  {sep}",
+            f"  RE-OPTIMIZED DAY {self.state.current_day} — timetable after disruption",
+            f"  {sep}",
+        ]
+        add = out.append
         if new_plan.route_points:
             for rp in new_plan.route_points:
                 arr = rp.arrival_time.strftime("%H:%M")   if rp.arrival_time   else "--:--"
@@ -2105,11 +2404,13 @@ class ReOptimizationSession:
                 tag = " [meal]" if getattr(rp, "activity_type", "") == "restaurant" else ""
                 cat = getattr(rp, "category", "")
                 cat_str = f"  ({cat})" if cat else ""
-                print(f"    [{rp.sequence:>2}] {rp.name}{tag}{cat_str}")
-                print(f"          {arr} – {dep}   {rp.visit_duration_minutes} min")
+                add(f"    [{rp.sequence:>2}] {rp.name}{tag}{cat_str}")
+                add(f"          {arr} – {dep}   {rp.visit_duration_minutes} min")
         else:
-            print("    (no stops — day is complete)")
-        print(f"  {sep}\n")
+            add("    (no stops — day is complete)")
+        add(f"  {sep}")
+        add("")
+        _emit(out)
 
         return new_plan
 
@@ -2134,16 +2435,15 @@ class ReOptimizationSession:
                 "suggested_alternatives": pd.suggested_alternatives,
                 "status": "AWAITING_DECISION",
             }
+        visited, skipped, deferred, remaining = self._summary_stops()
         return {
             "current_time":         self.state.current_time,
             "current_day":          self.state.current_day,
-            "visited":              sorted(self.state.visited_stops),
-            "skipped":              sorted(self.state.skipped_stops),
-            "deferred_same_day":    sorted(self.state.deferred_stops),
+            "visited":              visited,
+            "skipped":              skipped,
+            "deferred_same_day":    deferred,
             "deferred_future_days": dict(self.future_deferred),
-            "remaining_stops":      [a.name for a in self._remaining
-                                     if a.name not in self.state.visited_stops
-                                     and a.name not in self.state.skipped_stops],
+            "remaining_stops":      remaining,
             "remaining_minutes":    self.state.remaining_minutes_today(),
             "thresholds":           self.thresholds.describe(),
             "replans_triggered":    len(self.replan_history),
@@ -2153,6 +2453,33 @@ class ReOptimizationSession:
             "disruption_memory":    self._disruption_memory.summarize(),
         }
 
+    def _summary_stops(self) -> tuple[list[str], list[str], list[str], list[str]]:
+        """
+        (visited, skipped, deferred, remaining) name lists for summary().
+
+        Recomputed only after a TripState stop mutation or a change to
+        _remaining; fresh list copies are returned so callers may mutate them.
+        """
+        state = self.state
+        key = (state._stops_version, self._remaining_version)
+        if self._summary_memo is None or self._summary_memo[0] != key:
+            # Deferred stops are still "remaining"; everything else in the
+            # excluded union (visited ∪ skipped) is not.
+            held = state.deferred_stops - state.visited_stops - state.skipped_stops
+            if held:
+                excluded = state.excluded_stops
+                remaining = [a.name for a in self._remaining
+                             if a.name not in excluded or a.name in held]
+            else:
+                remaining = [a.name for a in self._active_pool()]
+            self._summary_memo = (key, (
+                sorted(state.visited_stops),
+                sorted(state.skipped_stops),
+                sorted(state.deferred_stops),
+                remaining,
+            ))
+        return tuple(list(names) for names in self._summary_memo[1])
+
     # ── Agent Controller integration ──────────────────────────────────────────
 
     def agent_evaluate(
@@ -2207,11 +2534,10 @@ class ReOptimizationSession:
         # 4. Update remaining pool + plan if execution produced a new plan
         if result.new_plan is not None:
             self.state.current_day_plan = result.new_plan
-            planned_names = {rp.name for rp in result.new_plan.route_points}
             self.replan_history.append({
                 "time": self.state.current_time,
                 "reasons": [action.reasoning],
-                "new_stops": list(planned_names),
+                "new_stops": [rp.name for rp in result.new_plan.route_points],
             })
 
         # 5. If alternatives were generated, build a PendingDecision
@@ -2224,7 +2550,7 @@ class ReOptimizationSession:
             self.pending_decision = PendingDecision(
                 disruption_type="AGENT",
                 impacted_pois=impacted,
-                reason=action.reasoning,
+                _reason=action.reasoning,
                 missed_value=obs.next_stop_spti_proxy,
                 proposed_actions=[
                     ProposedAction("REPLACE", action.target_poi or "", {}),
@@ -2237,7 +2563,7 @@ class ReOptimizationSession:
                     obs.traffic_level or 0.0,
                 ),
             )
-            self.pending_decision._rich_alternatives = result.alternatives  # type: ignore[attr-defined]
+            self.pending_decision._rich_alternatives = result.alternatives
             self._print_pending_decision(self.pending_decision)
 
         # 6. If a constraint was relaxed, log it
@@ -2308,11 +2634,10 @@ class ReOptimizationSession:
         # 4. Update plan if execution produced a new plan
         if exec_result.new_plan is not None:
             self.state.current_day_plan = exec_result.new_plan
-            planned_names = {rp.name for rp in exec_result.new_plan.route_points}
             self.replan_history.append({
                 "time": self.state.current_time,
                 "reasons": [result.action.reasoning],
-                "new_stops": list(planned_names),
+                "new_stops": [rp.name for rp in exec_result.new_plan.route_points],
                 "specialist": result.specialist_name,
             })
 
@@ -2326,7 +2651,7 @@ class ReOptimizationSession:
             self.pending_decision = PendingDecision(
                 disruption_type=f"AGENT:{result.specialist_name}",
                 impacted_pois=impacted,
-                reason=result.action.reasoning,
+                _reason=result.action.reasoning,
                 missed_value=obs.next_stop_spti_proxy,
                 proposed_actions=[
                     ProposedAction("REPLACE", result.action.target_poi or "", {}),
@@ -2339,7 +2664,7 @@ class ReOptimizationSession:
                     obs.traffic_level or 0.0,
                 ),
             )
-            self.pending_decision._rich_alternatives = exec_result.alternatives  # type: ignore[attr-defined]
+            self.pending_decision._rich_alternatives = exec_result.alternatives
             self._print_pending_decision(self.pending_decision)
 
         # 6. Log relaxed constraint
@@ -43,12 +43,23 @@ Constants (MISSING in spec — defined here with rationale):
 """
 
 from __future__ import annotations
+import importlib.util
 from dataclasses import dataclass, field
 from math import radians, sin, cos, sqrt, atan2
 
 from modules.tool_usage.attraction_tool import AttractionRecord
 from schemas.constraints import ConstraintBundle
 
+# numba / numpy are optional and only imported (and the kernel compiled) the
+# first time a pool reaches KERNEL_MIN_POOL — see _load_kernel().  Importing
+# this module never pays for numba.
+_NUMBA_AVAILABLE = (
+    importlib.util.find_spec("numba") is not None
+    and importlib.util.find_spec("numpy") is not None
+)
+np = None          # numpy, bound by _load_kernel()
+_KERNEL = None     # njit-compiled _haversine_minutes_many, set by _load_kernel()
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants
@@ -60,6 +71,9 @@ AVG_SPEED_CLEAR_KMH:        float = 20.0   # MISSING in spec
 AVG_SPEED_WALK_KMH:         float = 4.0    # MISSING in spec
 REPLAN_DELAY_THRESHOLD_MIN: int   = 20     # MISSING in spec
 EARTH_RADIUS_KM:            float = 6371.0
+# Pools at least this large use the compiled Dij kernel (when numba is
+# installed); below it the per-stop Python loop is cheaper than the array build.
+KERNEL_MIN_POOL:            int   = 64
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -122,20 +136,99 @@ def _haversine_minutes(
     return max(1.0, (d / speed_kmh) * 60)
 
 
+def _haversine_minutes_many(lat0, lon0, lats, lons, speed_kmh):
+    """
+    _haversine_minutes() from (lat0, lon0) to every (lats[i], lons[i]).
+    Returns a float64 array of travel times [min], floored at 1.0.
+    Compiled with numba by _load_kernel(); not called uncompiled.
+    """
+    n = lats.shape[0]
+    out = np.empty(n, np.float64)
+    phi1 = np.radians(lat0)
+    cos1 = np.cos(phi1)
+    for i in range(n):
+        phi2 = np.radians(lats[i])
+        dphi = np.radians(lats[i] - lat0)
+        dlam = np.radians(lons[i] - lon0)
+        a = np.sin(dphi / 2) ** 2 + cos1 * np.cos(phi2) * np.sin(dlam / 2) ** 2
+        d = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        out[i] = max(1.0, (d / speed_kmh) * 60)
+    return out
+
+
+def _load_kernel():
+    """Import numpy + numba and compile the Dij kernel once; None if unavailable."""
+    global np, _KERNEL, _NUMBA_AVAILABLE
+    if _KERNEL is None and _NUMBA_AVAILABLE:
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            _NUMBA_AVAILABLE = False
+            return None
+        np = numpy
+        _KERNEL = njit(cache=True)(_haversine_minutes_many)
+    return _KERNEL
+
+
+def pool_coords(pool: list[AttractionRecord]) -> tuple | None:
+    """
+    (lats, lons) float64 arrays for pool — the structure-of-arrays form
+    TrafficAdvisor.assess(coords=...) accepts.  None when the compiled
+    kernel would not be used for a pool of this size.
+    """
+    if len(pool) < KERNEL_MIN_POOL or _load_kernel() is None:
+        return None
+    n = len(pool)
+    return (
+        np.fromiter((a.location_lat for a in pool), np.float64, n),
+        np.fromiter((a.location_lon for a in pool), np.float64, n),
+    )
+
+
+def _base_travel_minutes(
+    current_lat: float,
+    current_lon: float,
+    pool: list[AttractionRecord],
+    coords: tuple | None = None,
+) -> list[float]:
+    """Dij_base [min] at clear-road speed from the current position to each stop."""
+    if coords is None:
+        coords = pool_coords(pool)
+    if coords is not None:
+        lats, lons = coords
+        return _load_kernel()(
+            current_lat, current_lon, lats, lons, AVG_SPEED_CLEAR_KMH,
+        ).tolist()
+    return [
+        _haversine_minutes(
+            current_lat, current_lon,
+            a.location_lat, a.location_lon,
+            AVG_SPEED_CLEAR_KMH,
+        )
+        for a in pool
+    ]
+
+
 def _effective_speed(delay_factor: float) -> float:
     """At extreme congestion (delay_factor > 2) switch to walking speed."""
     return AVG_SPEED_WALK_KMH if delay_factor > 2.0 else AVG_SPEED_CLEAR_KMH
 
 
-def _simple_S_pti(a: AttractionRecord, constraints: ConstraintBundle) -> float:
+def _interest_set(constraints: ConstraintBundle) -> frozenset[str]:
+    """Lower-cased soft.interests, built once per assess() call."""
+    return frozenset(i.lower() for i in (constraints.soft.interests or ()))
+
+
+def _simple_S_pti(
+    a:            AttractionRecord,
+    constraints:  ConstraintBundle,
+    interests_lc: frozenset[str],
+) -> float:
     """Lightweight FTRM score: rating normalised + category + preference bonuses."""
     rating_norm = (getattr(a, "rating", 3.0) - 1.0) / 4.0
     soft = constraints.soft
-    interest_bonus = (
-        0.15 if soft.interests and
-        any(i.lower() == a.category.lower() for i in soft.interests)
-        else 0.0
-    )
+    interest_bonus = 0.15 if a.category_lc in interests_lc else 0.0
     crowd_bonus = (
         0.10 if soft.avoid_crowds and not getattr(a, "is_outdoor", False)
         else 0.0
@@ -147,12 +240,13 @@ def _why_traffic_suitable(
     a: AttractionRecord,
     is_clustered: bool,
     constraints: ConstraintBundle,
+    interests_lc: frozenset[str],
 ) -> str:
     reasons: list[str] = []
     if is_clustered:
         reasons.append(f"nearby ({int(CLUSTER_RADIUS_MIN)} min or less in traffic)")
     soft = constraints.soft
-    if soft.interests and a.category.lower() in [i.lower() for i in soft.interests]:
+    if a.category_lc in interests_lc:
         reasons.append(f"matches interest in '{a.category}'")
     if not getattr(a, "is_outdoor", False):
         reasons.append("indoor — avoids weather+traffic exposure")
@@ -196,6 +290,7 @@ class TrafficAdvisor:
         current_lon:       float,
         remaining_minutes: int,
         top_n:             int = 3,
+        coords:            tuple | None = None,
     ) -> TrafficAdvisoryResult:
         """
         Deterministic traffic disruption assessment.
@@ -209,6 +304,9 @@ class TrafficAdvisor:
         If infeasible:
             S_pti ≥ HIGH_PRIORITY_THRESHOLD → DEFER
             S_pti <  HIGH_PRIORITY_THRESHOLD → REPLACE
+
+        coords, if given, is pool_coords(remaining_pool) — callers that keep
+        the pool across assessments can build it once and pass it in.
         """
         delay_factor = 1.0 + traffic_level
         speed        = _effective_speed(delay_factor)
@@ -218,14 +316,14 @@ class TrafficAdvisor:
         replaced:    list[TrafficFeasibility] = []
         keep_pool:   list[TrafficFeasibility] = []
 
-        for a in remaining_pool:
-            Dij_base = _haversine_minutes(
-                current_lat, current_lon,
-                a.location_lat, a.location_lon,
-                AVG_SPEED_CLEAR_KMH,
-            )
+        base_minutes = _base_travel_minutes(
+            current_lat, current_lon, remaining_pool, coords,
+        )
+        interests_lc = _interest_set(constraints)
+
+        for a, Dij_base in zip(remaining_pool, base_minutes):
             Dij_new  = Dij_base * delay_factor
-            S        = _simple_S_pti(a, constraints)
+            S        = _simple_S_pti(a, constraints, interests_lc)
             trip_ok  = (Dij_new + a.visit_duration_minutes) <= remaining_minutes
 
             # ── Defer vs Replace ──────────────────────────────────────────────
@@ -296,7 +394,9 @@ class TrafficAdvisor:
                 S_pti        = fi.S_pti,
                 Dij_new      = fi.Dij_new,
                 is_clustered = clustered,
-                why_suitable = _why_traffic_suitable(a, clustered, constraints),
+                why_suitable = _why_traffic_suitable(
+                    a, clustered, constraints, interests_lc,
+                ),
             ))
 
         # Sort: clustered first, then by η_ij_new descending
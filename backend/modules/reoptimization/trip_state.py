@@ -6,12 +6,21 @@ Updated as the traveler moves through stops and events occur.
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from schemas.itinerary import DayPlan
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _hhmm_to_minutes(hhmm: str) -> int:
+    """"HH:MM" → minutes since midnight (cached; clock strings repeat a lot)."""
+    h, m = hhmm.split(":")
+    return int(h) * 60 + int(m)
+
+
+@dataclass(slots=True)
 class TripState:
     """
     Tracks the real-time state of an active trip day.
@@ -66,26 +75,76 @@ class TripState:
     # ── Replan flag ───────────────────────────────────────────────────
     replan_pending: bool = False
 
+    # ── Derived: visited ∪ skipped ∪ deferred (kept in sync by helpers) ─
+    _excluded_union: set[str] = field(default_factory=set, init=False, repr=False)
+    # Bumped whenever _excluded_union changes — lets callers memoise filtered pools
+    _excluded_version: int = field(default=0, init=False, repr=False)
+    # Bumped by every visited / skipped / deferred mutation (even when the
+    # union is unchanged, e.g. a deferred stop promoted to skipped)
+    _stops_version: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._excluded_union = (
+            self.visited_stops | self.skipped_stops | self.deferred_stops
+        )
+
     # ── Helpers ───────────────────────────────────────────────────────
 
     def mark_visited(self, stop_name: str, cost: float = 0.0) -> None:
         """Mark a stop as completed and update position + budget."""
-        self.visited_stops.add(stop_name)
+        stop_name = sys.intern(stop_name)
+        if stop_name not in self.visited_stops:
+            self.visited_stops.add(stop_name)
+            self._exclude(stop_name)
+            self._stops_version += 1
         self.budget_spent["Attractions"] += cost
 
     def mark_skipped(self, stop_name: str) -> None:
         """Mark a stop as user-skipped (excluded from future plans too)."""
-        self.skipped_stops.add(stop_name)
+        stop_name = sys.intern(stop_name)
+        changed = stop_name not in self.skipped_stops
+        if changed:
+            self.skipped_stops.add(stop_name)
+            self._exclude(stop_name)
         # If it was deferred, promote to permanently skipped
-        self.deferred_stops.discard(stop_name)
+        if stop_name in self.deferred_stops:
+            self.deferred_stops.remove(stop_name)
+            changed = True
+        if changed:
+            self._stops_version += 1
 
     def defer_stop(self, stop_name: str) -> None:
         """Temporarily exclude a stop from the current replan (crowd deferral)."""
-        self.deferred_stops.add(stop_name)
+        stop_name = sys.intern(stop_name)
+        if stop_name not in self.deferred_stops:
+            self.deferred_stops.add(stop_name)
+            self._exclude(stop_name)
+            self._stops_version += 1
 
     def undefer_stop(self, stop_name: str) -> None:
         """Re-admit a stop to the planning pool (crowd may have cleared)."""
-        self.deferred_stops.discard(stop_name)
+        if stop_name not in self.deferred_stops:
+            return
+        self.deferred_stops.remove(stop_name)
+        self._stops_version += 1
+        if (stop_name not in self.visited_stops
+                and stop_name not in self.skipped_stops
+                and stop_name in self._excluded_union):
+            self._excluded_union.discard(stop_name)
+            self._excluded_version += 1
+
+    def _exclude(self, stop_name: str) -> None:
+        if stop_name not in self._excluded_union:
+            self._excluded_union.add(stop_name)
+            self._excluded_version += 1
+
+    @property
+    def excluded_stops(self) -> set[str]:
+        """
+        visited ∪ skipped ∪ deferred, maintained incrementally by the
+        mark_*/defer helpers.  Read-only view — do not mutate.
+        """
+        return self._excluded_union
 
     def advance_time(self, new_time: str) -> None:
         """Update current clock time, e.g. after arriving at a new stop."""
@@ -106,6 +165,6 @@ class TripState:
 
     def remaining_minutes_today(self, day_end_time: str = "20:00") -> int:
         """Minutes left from current_time until day_end_time."""
-        ch, cm = map(int, self.current_time.split(":"))
-        eh, em = map(int, day_end_time.split(":"))
-        return max((eh * 60 + em) - (ch * 60 + cm), 0)
+        return max(
+            _hhmm_to_minutes(day_end_time) - _hhmm_to_minutes(self.current_time), 0
+        )
@@ -35,13 +35,22 @@ Constants (MISSING in spec — defined here with rationale):
 """
 
 from __future__ import annotations
+import heapq
 from dataclasses import dataclass, field
+from functools import lru_cache
 from math import radians, sin, cos, sqrt, atan2
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from modules.tool_usage.attraction_tool import AttractionRecord
 from schemas.constraints import ConstraintBundle
 
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants
@@ -51,14 +60,18 @@ HC_UNSAFE_THRESHOLD:     float       = 0.75   # MISSING in spec
 DURATION_SCALE_FACTOR:   float       = 0.75   # MISSING in spec
 AVG_TRAVEL_SPEED_KMH:    float       = 4.0    # MISSING in spec
 EARTH_RADIUS_KM:         float       = 6371.0
+# Candidate pools at least this large get one vectorised Dij pass (numpy);
+# smaller pools stay on the scalar loop, which is cheaper than the array build.
+VECTOR_MIN_POOL:         int         = 16
 
-WEATHER_SENSITIVE_CATS: set[str] = {          # MISSING in spec
+# Read-only: _severity() memoises lookups into WEATHER_SEVERITY
+WEATHER_SENSITIVE_CATS: frozenset[str] = frozenset({   # MISSING in spec
     "beach", "park", "viewpoint", "rooftop", "market",
     "open_air_museum", "garden", "zoo", "amusement_park",
-}
+})
 
 # Severity map mirrors condition_monitor.WEATHER_SEVERITY
-WEATHER_SEVERITY: dict[str, float] = {
+WEATHER_SEVERITY: Mapping[str, float] = MappingProxyType({
     "clear":        0.00,
     "mostly_clear": 0.10,
     "cloudy":       0.30,
@@ -74,14 +87,14 @@ WEATHER_SEVERITY: dict[str, float] = {
     "foggy":        0.40,
     "hot":          0.35,
     "heatwave":     0.65,
-}
+})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Result types
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class WeatherImpact:
     """Describes how weather affects one specific POI."""
     attraction:        AttractionRecord
@@ -92,7 +105,7 @@ class WeatherImpact:
     reason:            str   = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherAlternative:
     """One indoor alternative suggestion ranked by η_ij."""
     attraction:   AttractionRecord
@@ -102,7 +115,7 @@ class WeatherAlternative:
     why_suitable: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherAdvisoryResult:
     """Full weather advisory package produced by WeatherAdvisor.classify()."""
     condition:         str
@@ -136,27 +149,81 @@ def _haversine_minutes(
     return max(1.0, (d / speed_kmh) * 60)        # minutes, floor 1
 
 
+def _haversine_minutes_vec(
+    lat0: float, lon0: float,
+    lats: "np.ndarray", lons: "np.ndarray",
+    speed_kmh: float = AVG_TRAVEL_SPEED_KMH,
+) -> "np.ndarray":
+    """_haversine_minutes() from (lat0, lon0) to every (lats[i], lons[i])."""
+    φ0  = radians(lat0)
+    φ   = np.radians(lats)
+    dφ  = φ - φ0
+    dλ  = np.radians(lons - lon0)
+    a   = np.sin(dφ / 2) ** 2 + cos(φ0) * np.cos(φ) * np.sin(dλ / 2) ** 2
+    d   = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return np.maximum(1.0, (d / speed_kmh) * 60)
+
+
+def _travel_minutes(
+    lat0: float, lon0: float,
+    pool: list[AttractionRecord],
+    speed_kmh: float = AVG_TRAVEL_SPEED_KMH,
+) -> list[float]:
+    """Dij [min] from (lat0, lon0) to each stop in pool, in pool order."""
+    if _NUMPY_AVAILABLE and len(pool) >= VECTOR_MIN_POOL:
+        n = len(pool)
+        lats = np.fromiter((a.location_lat for a in pool), np.float64, n)
+        lons = np.fromiter((a.location_lon for a in pool), np.float64, n)
+        return _haversine_minutes_vec(lat0, lon0, lats, lons, speed_kmh).tolist()
+    # Small pools (or no numpy): _haversine_minutes() inlined with the fixed
+    # endpoint's radians / cos hoisted out of the loop.
+    φ0, λ0 = radians(lat0), radians(lon0)
+    cos_φ0 = cos(φ0)
+    km_to_min = 2 * EARTH_RADIUS_KM / speed_kmh * 60
+    out: list[float] = []
+    for a in pool:
+        φ  = radians(a.location_lat)
+        h  = (sin((φ - φ0) / 2) ** 2
+              + cos_φ0 * cos(φ) * sin((radians(a.location_lon) - λ0) / 2) ** 2)
+        out.append(max(1.0, km_to_min * atan2(sqrt(h), sqrt(1 - h))))
+    return out
+
+
+@lru_cache(maxsize=64)
+def _severity(condition: str) -> float:
+    """WEATHER_SEVERITY for condition (any case); unknown conditions → 0.5."""
+    return WEATHER_SEVERITY.get(condition.lower(), 0.5)
+
+
 def _is_weather_sensitive(attraction: AttractionRecord) -> bool:
     """True if stop is outdoor or belongs to a weather-sensitive category."""
     return (
         getattr(attraction, "is_outdoor", False)
-        or attraction.category.lower() in WEATHER_SENSITIVE_CATS
+        or attraction.category_lc in WEATHER_SENSITIVE_CATS
     )
 
 
-def _simple_S_pti(attraction: AttractionRecord, constraints: ConstraintBundle) -> float:
+def _interest_set(constraints: ConstraintBundle) -> frozenset[str]:
+    """Lower-cased soft.interests, built once per classify() call."""
+    return frozenset(i.lower() for i in (constraints.soft.interests or ()))
+
+
+def _simple_S_pti(
+    attraction:   AttractionRecord,
+    constraints:  ConstraintBundle,
+    interests_lc: frozenset[str],
+) -> float:
     """
     Lightweight FTRM composite score (no full scorer import to avoid cycles).
     HC assumed = 1.0 for indoor candidates (already validated safe).
     SC approximated from rating + category match.
+    interests_lc is _interest_set(constraints).
     """
     rating_norm = (getattr(attraction, "rating", 3.0) - 1.0) / 4.0  # [0, 1]
 
     soft = constraints.soft
     interest_bonus = (
-        0.15 if soft.interests and
-        any(i.lower() == attraction.category.lower() for i in soft.interests)
-        else 0.0
+        0.15 if attraction.category_lc in interests_lc else 0.0
     )
     crowd_bonus = (
         0.10 if soft.avoid_crowds and not getattr(attraction, "is_outdoor", False)
@@ -197,76 +264,118 @@ class WeatherAdvisor:
         current_lon:       float,
         remaining_minutes: int,
         top_n:             int = 3,
+        coords:            tuple | None = None,
     ) -> WeatherAdvisoryResult:
         """
         Full deterministic weather classification + alternative ranking.
 
+        coords, if given, is (lats, lons) for remaining_pool in pool order
+        (see traffic_advisor.pool_coords) — lets a caller that keeps the
+        pool's coordinate arrays cached skip re-gathering them here.
+
         Decision rules:
             severity ≥ HC_UNSAFE_THRESHOLD : hc_override = 0.0  → BLOCKED
             threshold < severity < HC_UNSAFE: hc_override = 1.0 → DEFERRED
             is_outdoor = False              :                    → SAFE (candidate)
         """
-        severity = WEATHER_SEVERITY.get(condition.lower(), 0.5)
+        severity = _severity(condition)
 
         blocked:  list[WeatherImpact] = []
         deferred: list[WeatherImpact] = []
         safe:     list[AttractionRecord] = []
-
-        for a in remaining_pool:
+        safe_pos: list[int] = []          # index of each safe stop in remaining_pool
+
+        unsafe = severity >= HC_UNSAFE_THRESHOLD
+        # Same for every blocked stop — depends only on condition / severity
+        blocked_reason = (
+            f"Unsafe weather '{condition}' (severity {severity:.0%} ≥ "
+            f"HC_UNSAFE={HC_UNSAFE_THRESHOLD:.0%}) — "
+            f"HC_pti forced to 0; visit not viable."
+        ) if unsafe else ""
+
+        sensitive: list[AttractionRecord] = []
+        for i, a in enumerate(remaining_pool):
             if _is_weather_sensitive(a):
-                if severity >= HC_UNSAFE_THRESHOLD:
-                    # HC override → 0. Stop must not be visited.
-                    blocked.append(WeatherImpact(
-                        attraction    = a,
-                        hc_override   = 0.0,
-                        is_blocked    = True,
-                        adjusted_duration = a.visit_duration_minutes,
-                        reason        = (
-                            f"Unsafe weather '{condition}' (severity {severity:.0%} ≥ "
-                            f"HC_UNSAFE={HC_UNSAFE_THRESHOLD:.0%}) — "
-                            f"HC_pti forced to 0; visit not viable."
-                        ),
-                    ))
-                else:
-                    # Risky but not unsafe → defer, scale duration down
-                    adj = max(
-                        a.min_visit_duration_minutes,
-                        int(a.visit_duration_minutes * DURATION_SCALE_FACTOR),
-                    )
-                    deferred.append(WeatherImpact(
-                        attraction    = a,
-                        hc_override   = 1.0,
-                        is_deferred   = True,
-                        adjusted_duration = adj,
-                        reason        = (
-                            f"Risky outdoor stop in '{condition}' — visit shortened "
-                            f"to {adj} min (×{DURATION_SCALE_FACTOR})."
-                        ),
-                    ))
+                sensitive.append(a)
             else:
                 safe.append(a)
+                safe_pos.append(i)
+
+        # unsafe is fixed for the call — branch once, not per stop
+        if unsafe:
+            # HC override → 0. Stops must not be visited.
+            blocked = [
+                WeatherImpact(
+                    attraction    = a,
+                    hc_override   = 0.0,
+                    is_blocked    = True,
+                    adjusted_duration = a.visit_duration_minutes,
+                    reason        = blocked_reason,
+                )
+                for a in sensitive
+            ]
+        else:
+            # Risky but not unsafe → defer, scale duration down
+            for a in sensitive:
+                adj = max(
+                    a.min_visit_duration_minutes,
+                    int(a.visit_duration_minutes * DURATION_SCALE_FACTOR),
+                )
+                deferred.append(WeatherImpact(
+                    attraction    = a,
+                    hc_override   = 1.0,
+                    is_deferred   = True,
+                    adjusted_duration = adj,
+                    reason        = (
+                        f"Risky outdoor stop in '{condition}' — visit shortened "
+                        f"to {adj} min (×{DURATION_SCALE_FACTOR})."
+                    ),
+                ))
 
         # ── Rank indoor alternatives by η_ij = S_pti / Dij_new ──────────────
-        candidates: list[WeatherAlternative] = []
-        for a in safe:
-            Dij = _haversine_minutes(
-                current_lat, current_lon,
-                a.location_lat, a.location_lon,
+        # Drop stops that cannot fit in the remaining time before any Dij work;
+        # with no alternatives requested there is nothing to rank at all.
+        fit_pos: list[int] = []
+        if top_n > 0:
+            fit_pos = [
+                p for a, p in zip(safe, safe_pos)
+                if a.visit_duration_minutes <= remaining_minutes
+            ]
+        fits = [remaining_pool[p] for p in fit_pos]
+        if coords is not None:
+            lats, lons = coords
+            travel = _haversine_minutes_vec(
+                current_lat, current_lon, lats[fit_pos], lons[fit_pos],
                 AVG_TRAVEL_SPEED_KMH,
-            )
-            if a.visit_duration_minutes > remaining_minutes:
-                continue   # not feasible in remaining time
-            S   = _simple_S_pti(a, constraints)
+            ).tolist()
+        else:
+            travel = _travel_minutes(current_lat, current_lon, fits)
+        interests_lc = _interest_set(constraints)
+        # Running top-n min-heap of (η, -k, S, Dij).  S_pti ≤ 1.0, so 1/Dij
+        # bounds η: a stop whose bound cannot beat the heap minimum is skipped
+        # before scoring.  -k keeps heapq.nlargest's tie order (earlier wins).
+        top: list[tuple[float, int, float, float]] = []
+        for k, (a, Dij) in enumerate(zip(fits, travel)):
+            full = len(top) == top_n
+            if full and (1.0 / Dij if Dij > 0 else 0.0) <= top[0][0]:
+                continue
+            S   = _simple_S_pti(a, constraints, interests_lc)
             eta = S / Dij if Dij > 0 else 0.0
-            candidates.append(WeatherAlternative(
-                attraction   = a,
+            if not full:
+                heapq.heappush(top, (eta, -k, S, Dij))
+            elif (eta, -k) > top[0][:2]:
+                heapq.heapreplace(top, (eta, -k, S, Dij))
+
+        ranked = [
+            WeatherAlternative(
+                attraction   = fits[-neg_k],
                 eta_ij       = eta,
                 S_pti        = S,
                 Dij_new      = Dij,
-                why_suitable = _why_weather_suitable(a, constraints),
-            ))
-
-        ranked = sorted(candidates, key=lambda x: x.eta_ij, reverse=True)[:top_n]
+                why_suitable = _why_weather_suitable(fits[-neg_k], interests_lc),
+            )
+            for eta, neg_k, S, Dij in sorted(top, reverse=True)
+        ]
 
         # ── Duration adjustment map ───────────────────────────────────────────
         dur_adj: dict[str, int] = {}
@@ -312,10 +421,9 @@ class WeatherAdvisor:
 # Why-suitable builder for weather alternatives
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _why_weather_suitable(a: AttractionRecord, constraints: ConstraintBundle) -> str:
+def _why_weather_suitable(a: AttractionRecord, interests_lc: frozenset[str]) -> str:
     reasons: list[str] = ["indoor — protected from weather"]
-    soft = constraints.soft
-    if soft.interests and a.category.lower() in [i.lower() for i in soft.interests]:
+    if a.category_lc in interests_lc:
         reasons.append(f"matches your interest in '{a.category}'")
     if not a.is_outdoor:
         reasons.append("indoor — fully weather-protected")
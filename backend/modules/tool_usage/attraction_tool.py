@@ -20,7 +20,8 @@ Removed: entry_cost, optimal_visit_time, min_age, ticket_required,
 from __future__ import annotations
 import json
 import re
-import urllib.request
+import sys
+import threading
 import urllib.parse
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -382,7 +383,7 @@ def _normalize_opening_hours(weekday_descs: list[str]) -> str:
     return ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AttractionRecord:
     """
     Single attraction returned from Google Places API (New).
@@ -425,6 +426,14 @@ class AttractionRecord:
     city: str = ""                 # normalised lowercase city name; set by AttractionTool.fetch()
     # Used in main.py data-consistency check: attr.city must == destination_city
     raw: dict = field(default_factory=dict)
+    # DERIVED: category.lower(), for the advisors' per-stop category lookups
+    category_lc: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned so excluded-set lookups (TripState interns too) hit the
+        # identity fast path instead of a full string compare.
+        self.name = sys.intern(self.name)
+        self.category_lc = self.category.lower()
 
 
 
@@ -998,6 +1007,9 @@ _STUB_CITY_DATA: dict[str, Any] = {
 # ---------------------------------------------------------------------------
 STUB_CITIES: frozenset[str] = frozenset(_STUB_CITY_DATA.keys())
 
+# city → validated stub records, filled on first fetch (see AttractionTool.fetch)
+_STUB_RECORDS: dict[str, tuple[AttractionRecord, ...]] = {}
+
 # ---------------------------------------------------------------------------
 # §4 Required-field validator — enforces data integrity on every record.
 # Raises ERROR_INCOMPLETE_DATA if any required field is absent or default-zero.
@@ -1032,6 +1044,63 @@ def _validate_attraction_record(r: "AttractionRecord", city: str) -> None:
 # Used when USE_STUB_ATTRACTIONS=false. Requires GOOGLE_PLACES_API_KEY.
 # ---------------------------------------------------------------------------
 
+# Keep-alive HTTPS connections, one per (thread, host).  urlopen() opens a new
+# socket + TLS handshake per call; reusing the connection makes warm calls
+# pay only the request round-trip.
+_HTTP_LOCAL = threading.local()
+
+
+def _https_request(
+    host: str,
+    path: str,
+    *,
+    method: str = "GET",
+    body: bytes | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 10,
+) -> tuple[int, bytes]:
+    """Send one request over the pooled connection to *host*; return (status, body).
+
+    A pooled socket the server has since closed fails on first use, so a
+    request on a *reused* connection that dies before any response arrives
+    (RemoteDisconnected, reset or broken pipe) is retried once on a fresh
+    connection.  Timeouts, failures on a fresh connection and errors after
+    the response has started propagate to the caller — retrying those could
+    repeat a request the server already acted on.
+    """
+    # Deferred: http.client pulls in ssl, which modules that only need
+    # AttractionRecord (the advisors) should not pay for at import.
+    import http.client
+
+    pool: dict[str, http.client.HTTPSConnection] = getattr(_HTTP_LOCAL, "conns", None) or {}
+    _HTTP_LOCAL.conns = pool
+    while True:
+        conn = pool.get(host)
+        reused = conn is not None
+        if conn is None:
+            conn = pool[host] = http.client.HTTPSConnection(host, timeout=timeout)
+        conn.timeout = timeout
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            resp = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError,
+                ConnectionAbortedError, BrokenPipeError):
+            conn.close()
+            del pool[host]
+            if reused:
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            del pool[host]
+            raise
+        try:
+            return resp.status, resp.read()
+        except BaseException:
+            conn.close()
+            del pool[host]
+            raise
+
 def _geocode_city(city_name: str, api_key: str) -> tuple[float, float]:
     """Resolve a city name to (lat, lon).
 
@@ -1044,10 +1113,13 @@ def _geocode_city(city_name: str, api_key: str) -> tuple[float, float]:
         return _CITY_CENTERS[key]
 
     params = urllib.parse.urlencode({"address": city_name, "key": api_key})
-    url = f"https://maps.googleapis.com/maps/api/geocode/json?{params}"
     try:
-        with urllib.request.urlopen(url, timeout=10) as resp:
-            data = json.loads(resp.read())
+        status, raw = _https_request(
+            "maps.googleapis.com", f"/maps/api/geocode/json?{params}", timeout=10
+        )
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+        data = json.loads(raw)
     except Exception as exc:
         raise ValueError(
             f"ERROR_NO_DATA_FOR_CITY: Geocoding network error for '{city_name}': {exc}"
@@ -1117,7 +1189,6 @@ def _google_places_nearby(lat: float, lon: float, api_key: str) -> list["Attract
     Raises RuntimeError if the API call fails or returns a non-200 response.
     Returns an empty list (not None) if the API returns zero places.
     """
-    url = "https://places.googleapis.com/v1/places:searchNearby"
     payload = json.dumps({
         "includedTypes": _INCLUDED_TYPES,
         "maxResultCount": config.GOOGLE_PLACES_MAX_RESULTS,
@@ -1129,19 +1200,28 @@ def _google_places_nearby(lat: float, lon: float, api_key: str) -> list["Attract
         },
         "rankPreference": "POPULARITY",
     }).encode("utf-8")
-    req = urllib.request.Request(url, data=payload, method="POST")
-    req.add_header("Content-Type", "application/json")
-    req.add_header("X-Goog-Api-Key", api_key)
-    req.add_header("X-Goog-FieldMask", _FIELD_MASK)
+    headers = {
+        "Content-Type": "application/json",
+        "X-Goog-Api-Key": api_key,
+        "X-Goog-FieldMask": _FIELD_MASK,
+    }
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
+        status, raw = _https_request(
+            "places.googleapis.com", "/v1/places:searchNearby",
+            method="POST", body=payload, headers=headers, timeout=15,
+        )
+    except Exception as exc:
         raise RuntimeError(
-            f"Google Places API HTTP {exc.code}: {body[:300]}"
+            f"Google Places API network error: {exc}"
         ) from exc
-    except Exception as exc:
+    if status != 200:
+        body = raw.decode("utf-8", errors="replace")
+        raise RuntimeError(
+            f"Google Places API HTTP {status}: {body[:300]}"
+        )
+    try:
+        data = json.loads(raw)
+    except ValueError as exc:
         raise RuntimeError(
             f"Google Places API network error: {exc}"
         ) from exc
@@ -1189,26 +1269,33 @@ class AttractionTool:
                     "or generate placeholder attractions."
                 )
 
-            records = _STUB_CITY_DATA[city_norm]()
-
-            # ── §4  Required-field validation ────────────────────────────────────
-            # Abort if any record is missing name / location / category.
-            for r in records:
-                _validate_attraction_record(r, city_norm)
-
-            # ── Stamp canonical city name on every record ─────────────────────────
-            for r in records:
-                r.city = city_norm
+            # Built, validated and city-stamped once per city; records are not
+            # mutated after fetch, so every call shares them via a fresh list.
+            cached = _STUB_RECORDS.get(city_norm)
+            if cached is None:
+                records = _STUB_CITY_DATA[city_norm]()
+
+                # ── §4  Required-field validation ────────────────────────────────────
+                # Abort if any record is missing name / location / category.
+                for r in records:
+                    _validate_attraction_record(r, city_norm)
+
+                # ── Stamp canonical city name on every record ─────────────────────────
+                for r in records:
+                    r.city = city_norm
+
+                # ── §3  assert fetched_city == requested_city (HARD_FAIL on mismatch) ─
+                mismatched_city = [r.name for r in records if r.city != city_norm]
+                if mismatched_city:
+                    raise RuntimeError(
+                        f"HARD_FAIL: city stamp mismatch after fetch — "
+                        f"{len(mismatched_city)} record(s) have .city != '{city_norm}': "
+                        f"{mismatched_city[:5]}. "
+                        "Aborting. DO NOT infer or substitute city."
+                    )
+                cached = _STUB_RECORDS[city_norm] = tuple(records)
+            records = list(cached)
 
-            # ── §3  assert fetched_city == requested_city (HARD_FAIL on mismatch) ─
-            mismatched_city = [r.name for r in records if r.city != city_norm]
-            if mismatched_city:
-                raise RuntimeError(
-                    f"HARD_FAIL: city stamp mismatch after fetch — "
-                    f"{len(mismatched_city)} record(s) have .city != '{city_norm}': "
-                    f"{mismatched_city[:5]}. "
-                    "Aborting. DO NOT infer or substitute city."
-                )
             print(f"  [AttractionTool] Returning stub attraction data for â€˜{destination}â€™ "
                   f"({len(records)} records, city=â€˜{city_norm}â€™)")
             return records
@@ -15,6 +15,7 @@ Output: HistoricalInsight dataclass with format_for_display() word-wrapper.
 
 from __future__ import annotations
 import textwrap
+import threading
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -92,6 +93,10 @@ class HistoricalInsightTool:
     def __init__(self, llm_client: Any = None) -> None:
         self._llm    = llm_client
         self._cache: dict[str, HistoricalInsight] = {}
+        # The session prefetches insights from a worker thread; the lock is
+        # not held across the LLM call, so a racing lookup may resolve the
+        # same place twice but both callers get the first stored result.
+        self._lock   = threading.Lock()
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -127,8 +132,10 @@ class HistoricalInsightTool:
         Uses cache to avoid repeated LLM calls for the same place.
         """
         cache_key = f"{place_name}::{city}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        with self._lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Priority 1: pre-filled record field
         if prefilled and prefilled.strip():
@@ -139,8 +146,7 @@ class HistoricalInsightTool:
                 importance=prefilled.strip(),
                 source="record",
             )
-            self._cache[cache_key] = insight
-            return insight
+            return self._store(cache_key, insight)
 
         # Priority 2: LLM call
         if not config.USE_STUB_LLM and self._llm is not None:
@@ -153,8 +159,7 @@ class HistoricalInsightTool:
                     importance=importance,
                     source="llm",
                 )
-                self._cache[cache_key] = insight
-                return insight
+                return self._store(cache_key, insight)
             except Exception:
                 pass  # fall through to stub
 
@@ -166,11 +171,15 @@ class HistoricalInsightTool:
             importance=_stub_importance(category),
             source="stub",
         )
-        self._cache[cache_key] = insight
-        return insight
+        return self._store(cache_key, insight)
 
     # ── Private ───────────────────────────────────────────────────────────────
 
+    def _store(self, cache_key: str, insight: HistoricalInsight) -> HistoricalInsight:
+        """Cache *insight* unless another thread got there first; return the cached one."""
+        with self._lock:
+            return self._cache.setdefault(cache_key, insight)
+
     def _call_llm(self, place_name: str, city: str, category: str) -> str:
         """Call LLM to generate a 2–3 sentence historical importance paragraph."""
         prompt = (
@@ -27,7 +27,7 @@ Implements the checks specified in 06-ingestion-pipeline.md § 5.5:
 Usage:
     from modules.validation import validate_attraction, validate_graph_edge
 
-    result = validate_attraction(record.__dict__)
+    result = validate_attraction(asdict(record))
     if not result.valid:
         print(result.errors)
 
@@ -36,7 +36,7 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import date
 from typing import Any, Callable, TypeVar
 
@@ -238,6 +238,13 @@ def validate_day_number(record: dict[str, Any]) -> ValidationResult:
 
 # ── Batch filter helper ────────────────────────────────────────────────────────
 
+def _record_dict(item: Any) -> dict:
+    """Field dict for a record — slotted dataclasses have no __dict__."""
+    if is_dataclass(item) and not hasattr(item, "__dict__"):
+        return asdict(item)
+    return item.__dict__
+
+
 def filter_valid(
     items: list[T],
     validator: Callable[[dict], ValidationResult],
@@ -251,7 +258,7 @@ def filter_valid(
         items:     List of items (dataclass instances or dicts).
         validator: One of validate_attraction / validate_graph_edge / validate_trip.
         to_dict:   Optional callable to convert each item to a dict.
-                   If None, items are assumed to already be dicts or have __dict__.
+                   If None, items are assumed to already be dicts or dataclasses.
         log:       If True, print a warning for every rejected record.
 
     Returns:
@@ -264,7 +271,7 @@ def filter_valid(
         record_dict = (
             to_dict(item)
             if to_dict is not None
-            else (item if isinstance(item, dict) else item.__dict__)
+            else (item if isinstance(item, dict) else _record_dict(item))
         )
         result = validator(record_dict)
         if result.valid:
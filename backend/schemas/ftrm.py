@@ -24,7 +24,7 @@ from typing import Optional
 # Graph entities  G = (V, E)
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class FTRMNode:
     """
     A vertex v ∈ V in the POI graph.
@@ -48,7 +48,7 @@ class FTRMNode:
     is_end: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FTRMEdge:
     """
     An edge (i,j) ∈ E in the POI graph.
@@ -75,10 +75,19 @@ class FTRMGraph:
 
     # Derived at build time
     adjacency: dict[tuple[int, int], float] = field(default_factory=dict)
+    _node_by_id: dict[int, FTRMNode] = field(default_factory=dict, init=False, repr=False)
+    # adjacency split by source node: _rows[i][j] = Dij — see Dij_row()
+    _rows: dict[int, dict[int, float]] = field(default_factory=dict, init=False, repr=False)
 
     def build_adjacency(self) -> None:
-        """Populate adjacency dict from edges list."""
+        """Populate adjacency dict from edges list (and the node_id index)."""
         self.adjacency = {(e.i, e.j): e.Dij for e in self.edges}
+        rows: dict[int, dict[int, float]] = {}
+        for (i, j), d in self.adjacency.items():
+            rows.setdefault(i, {})[j] = d
+        self._rows = rows
+        # reversed → first occurrence wins, as with the linear scan
+        self._node_by_id = {n.node_id: n for n in reversed(self.nodes)}
 
     def get_Dij(self, i: int, j: int) -> float:
         """
@@ -87,8 +96,18 @@ class FTRMGraph:
         """
         return self.adjacency.get((i, j), float("inf"))
 
+    def Dij_row(self, i: int) -> dict[int, float]:
+        """
+        {j: Dij} for every edge leaving node i (missing j ⇒ no edge).
+        Lets callers scanning all successors of one node skip the per-pair
+        tuple key of get_Dij().  Read-only; valid after build_adjacency().
+        """
+        return self._rows.get(i, {})
+
     def get_node(self, node_id: int) -> Optional[FTRMNode]:
-        """Return node by node_id."""
+        """Return node by node_id (O(1) once build_adjacency() has run)."""
+        if self._node_by_id:
+            return self._node_by_id.get(node_id)
         for n in self.nodes:
             if n.node_id == node_id:
                 return n
@@ -99,12 +118,14 @@ class FTRMGraph:
 # ACO & optimization parameters
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FTRMParameters:
     """
     All tunable parameters for the FTRM optimization model.
 
     Defaults from user completions (SUGGESTED DEFAULT — tune empirically).
+    Frozen + slotted: built once per plan/replan and read in the ACO hot loop,
+    so consumers may safely unpack fields once (see ACOOptimizer.__init__).
     """
     # ── Temporal ──────────────────────────────────────────────────────────────
     Tmax: float = 480.0                  # minutes per day (default 8 hours)
@@ -132,3 +153,8 @@ class FTRMParameters:
     # "best_ant" = deposit only on best tour (RECOMMENDED — lower noise)
     # "all_ants" = deposit from all ants
     pheromone_update_strategy: str = "best_ant"
+
+    # ── Execution backend ─────────────────────────────────────────────────────
+    # "python" = pure-Python ACO (default, no extra dependencies)
+    # "numba"  = parallel tour construction (requires numba + numpy)
+    backend: str = "python"
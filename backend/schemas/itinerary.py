@@ -14,7 +14,7 @@ from datetime import date, time
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BudgetAllocation:
     """
     Budget distributed by the deterministic BudgetPlanner engine.
@@ -34,6 +34,10 @@ class BudgetAllocation:
                           "CITY_INDEX"      (city-level cost index used as fallback)
                           "MISSING_COST_DATA" (no pricing source found)
                           "PENDING"         (not yet computed)
+
+    Frozen: BudgetPlanner builds a new allocation for every rebalance, so an
+    instance never changes once handed to the planner / session — which is
+    what lets `total` be summed once in __post_init__.
     """
     # ── Financial categories ──────────────────────────────────────────────────
     Accommodation:  float = 0.0
@@ -48,16 +52,21 @@ class BudgetAllocation:
     RebalanceApplied: bool = False
     DataQuality:      str  = "PENDING"
 
+    _total: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_total", (
+            self.Accommodation + self.Attractions + self.Restaurants
+            + self.Transportation + self.Other_Expenses + self.Reserve_Fund
+        ))
+
     @property
     def total(self) -> float:
         """Sum of the six financial categories only (excludes metadata fields)."""
-        return (
-            self.Accommodation + self.Attractions + self.Restaurants
-            + self.Transportation + self.Other_Expenses + self.Reserve_Fund
-        )
+        return self._total
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutePoint:
     """
     A single stop in a day's itinerary.
@@ -77,7 +86,7 @@ class RoutePoint:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DayPlan:
     """One day's scheduled activities."""
     day_number: int = 0
@@ -86,7 +95,7 @@ class DayPlan:
     daily_budget_used: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Itinerary:
     """
     Top-level output of the Planning Module.
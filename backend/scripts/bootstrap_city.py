@@ -37,6 +37,7 @@ import argparse
 import json
 import os
 import sys
+from dataclasses import asdict
 from datetime import datetime, timezone
 
 # ── Make sure backend root is on path ─────────────────────────────────────────
@@ -162,7 +163,7 @@ def bootstrap_city(
     valid_records = filter_valid(
         records,
         validate_attraction,
-        to_dict=lambda r: r.__dict__,
+        to_dict=asdict,
         log=True,
     )
     print(f"  → {len(valid_records)} valid POIs after validation.")
@@ -0,0 +1,72 @@
+import pytest
+
+from schemas.ftrm import FTRMGraph, FTRMNode, FTRMEdge, FTRMParameters
+from modules.optimization.aco_optimizer import ACOOptimizer
+
+# Helper
+def build_line_graph(n: int = 6, step_min: float = 10.0, sti: float = 30.0) -> FTRMGraph:
+    # Node 0 = START, nodes 1..n-1 = POIs spaced step_min apart on a line
+    nodes = [FTRMNode(node_id=0, name="START", is_start=True)]
+    nodes += [FTRMNode(node_id=i, name=f"P{i}", Si=0.8, STi=sti) for i in range(1, n)]
+    edges = [
+        FTRMEdge(i=a.node_id, j=b.node_id, Dij=abs(a.node_id - b.node_id) * step_min)
+        for a in nodes for b in nodes if a.node_id != b.node_id
+    ]
+    graph = FTRMGraph(nodes=nodes, edges=edges)
+    graph.build_adjacency()
+    return graph
+
+def assert_feasible(tour, graph, Tmax):
+    assert tour.path[0] == 0
+    assert len(set(tour.path)) == len(tour.path), "Eq 8: visit-once"
+    elapsed = sum(
+        graph.get_Dij(i, j) + graph.get_node(j).STi
+        for i, j in zip(tour.path, tour.path[1:])
+    )
+    assert elapsed == pytest.approx(tour.total_cost)
+    assert elapsed <= Tmax, "Eq 10: Tmax"
+
+@pytest.mark.parametrize("strategy", ["best_ant", "all_ants"])
+def test_python_backend_respects_tmax(strategy):
+    graph = build_line_graph()
+    S = {0: 0.0, **{i: 0.8 for i in range(1, 6)}}
+    params = FTRMParameters(Tmax=120.0, num_ants=5, num_iterations=10,
+                            pheromone_update_strategy=strategy)
+
+    tour = ACOOptimizer(graph, S, params, seed=7).run()
+
+    assert len(tour.path) > 1
+    assert_feasible(tour, graph, params.Tmax)
+
+@pytest.mark.parametrize("strategy", ["best_ant", "all_ants"])
+def test_numba_backend_respects_tmax(strategy):
+    pytest.importorskip("numba")
+    graph = build_line_graph()
+    S = {0: 0.0, 1: 0.8, 2: 0.0, 3: 0.8, 4: 0.8, 5: 0.8}   # node 2 HC-gated
+    params = FTRMParameters(Tmax=120.0, num_ants=5, num_iterations=10,
+                            pheromone_update_strategy=strategy, backend="numba")
+
+    aco = ACOOptimizer(graph, S, params)
+    tour = aco.run()
+
+    assert len(tour.path) > 1
+    assert 2 not in tour.path, "HC gate: S_pti = 0 is never visited"
+    assert_feasible(tour, graph, params.Tmax)
+    assert all(isinstance(v, float) for v in aco.tau.values())
+
+def test_split_local_update_matches_sequential_eq15():
+    graph = build_line_graph()
+    S = {0: 0.0, **{i: 0.8 for i in range(1, 6)}}
+    params = FTRMParameters(rho=0.2, Q=2.0)
+    aco = ACOOptimizer(graph, S, params)
+    tours = [aco._construct_tour() for _ in range(4)]
+
+    # Reference: per-ant τ ← (1−ρ)τ + δ_k over every edge
+    expected = dict(aco.tau)
+    for t in tours:
+        delta = aco._compute_delta(t)
+        expected = {e: (1 - params.rho) * v + delta.get(e, 0.0) for e, v in expected.items()}
+
+    aco._local_pheromone_update(tours)
+
+    assert aco.tau == pytest.approx(expected)
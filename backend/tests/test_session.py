@@ -0,0 +1,45 @@
+from schemas.constraints import ConstraintBundle
+from schemas.itinerary import BudgetAllocation
+from modules.reoptimization.session import ReOptimizationSession
+from modules.reoptimization.trip_state import TripState
+from modules.tool_usage.attraction_tool import AttractionRecord
+
+
+def _record(name: str, is_outdoor: bool, lon: float) -> AttractionRecord:
+    return AttractionRecord(
+        name=name, location_lat=28.6, location_lon=lon, rating=4.5,
+        category="park" if is_outdoor else "museum", is_outdoor=is_outdoor,
+    )
+
+
+def test_drizzle_gate_uses_thresholds_rederived_after_advancing():
+    pool = [
+        _record("Museum A", False, 77.20),
+        _record("Museum B", False, 77.21),
+        _record("Garden C", True, 77.22),
+        _record("Garden D", True, 77.23),
+    ]
+    session = ReOptimizationSession(
+        state=TripState(current_lat=28.6, current_lon=77.2),
+        constraints=ConstraintBundle(),
+        remaining_attractions=pool,
+        budget=BudgetAllocation(),
+    )
+    # Half the pool is outdoor: drizzle (55%) is under the 65% threshold
+    session.check_conditions(
+        weather_condition="drizzle", next_stop_name="Museum A",
+        next_stop_is_outdoor=False, crowd_level=0.0, traffic_level=0.0,
+    )
+    assert session.pending_decision is None
+
+    # Past the indoor stops the monitor drops the weather threshold to 40%
+    session.advance_to_stop("Museum A", "10:00", lat=28.6, lon=77.20)
+    session.advance_to_stop("Museum B", "11:15", lat=28.6, lon=77.21)
+    session.check_conditions(
+        weather_condition="drizzle", next_stop_name="Garden C",
+        next_stop_is_outdoor=True, crowd_level=0.0, traffic_level=0.0,
+    )
+    pd = session.pending_decision
+    assert pd is not None
+    assert pd.disruption_type == "WEATHER"
+    assert "threshold 40%" in pd.reason
@@ -0,0 +1,32 @@
+from modules.reoptimization.trip_state import TripState
+
+
+def test_excluded_stops_tracks_mark_and_defer_helpers():
+    state = TripState(visited_stops={"A"})
+    assert state.excluded_stops == {"A"}
+
+    state.defer_stop("B")
+    state.mark_skipped("C")
+    assert state.excluded_stops == {"A", "B", "C"}
+
+    state.undefer_stop("B")
+    assert state.excluded_stops == {"A", "C"}
+
+    # Deferred → skipped stays excluded after a stray undefer
+    state.defer_stop("D")
+    state.mark_skipped("D")
+    state.undefer_stop("D")
+    assert state.excluded_stops == (
+        state.visited_stops | state.skipped_stops | state.deferred_stops
+    )
+
+
+def test_stops_version_bumps_when_union_is_unchanged():
+    state = TripState()
+    state.defer_stop("A")
+    excluded_v, stops_v = state._excluded_version, state._stops_version
+
+    # Deferred → skipped: same union, different per-set contents
+    state.mark_skipped("A")
+    assert state._excluded_version == excluded_v
+    assert state._stops_version > stops_v